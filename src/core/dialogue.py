@@ -1,7 +1,10 @@
 from __future__ import annotations
 
+import sys
+from array import array
 from dataclasses import dataclass, field
-from typing import Callable, Iterable, Protocol
+from functools import partial
+from typing import Callable, Iterable, Mapping, Protocol
 
 
 class DialogueEventCallback(Protocol):
@@ -13,6 +16,8 @@ class DialogueChoice:
     text: str
     next_id: str | None = None
     event: str | None = None
+    # Position of the target node in its DialogueGraph, -1 ends the dialogue.
+    next_idx: int = field(default=-1, init=False, repr=False, compare=False)
 
 
 @dataclass(slots=True)
@@ -23,34 +28,64 @@ class DialogueNode:
     choices: list[DialogueChoice] = field(default_factory=list)
     enter_event: str | None = None
     exit_event: str | None = None
+    # Set by DialogueManager.register; choices are not mutated afterwards.
+    has_choices_flag: bool = field(default=False, init=False, repr=False, compare=False)
+    # ``text`` split on spaces once; text is not mutated after construction.
+    words: tuple[str, ...] = field(default=(), init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        if self.text:
+            self.words = tuple(self.text.split(" "))
 
     def has_choices(self) -> bool:
-        return bool(self.choices)
+        return self.has_choices_flag
+
+
+class DialogueGraph:
+    """A registered dialogue with node links resolved to list positions."""
+
+    __slots__ = ("nodes", "index", "next_idx", "exit_events")
+
+    def __init__(self, nodes: Iterable[DialogueNode]) -> None:
+        self.nodes: list[DialogueNode] = list(nodes)
+        self.index: dict[str, int] = {node.node_id: i for i, node in enumerate(self.nodes)}
+        self.next_idx = array("i", (self._resolve(node.next_id) for node in self.nodes))
+        self.exit_events: list[str | None] = [node.exit_event for node in self.nodes]
+        for node in self.nodes:
+            for choice in node.choices:
+                choice.next_idx = self._resolve(choice.next_id)
+
+    def _resolve(self, node_id: str | None) -> int:
+        if node_id is None:
+            return -1
+        try:
+            return self.index[node_id]
+        except KeyError:
+            raise ValueError(f"Dialogue node '{node_id}' not found.") from None
 
 
 class DialogueSession:
     """Tracks the current position inside a dialogue graph."""
 
+    __slots__ = ("graph", "current_idx", "current_node", "event_callback", "choice_index")
+
     def __init__(
         self,
-        nodes: dict[str, DialogueNode],
+        graph: DialogueGraph,
         start_id: str,
         event_callback: DialogueEventCallback | None = None,
     ) -> None:
-        if start_id not in nodes:
+        if start_id not in graph.index:
             raise ValueError(f"Dialogue node '{start_id}' not found.")
 
-        self.nodes = nodes
-        self.current_id = start_id
+        self.graph = graph
+        self.current_idx = graph.index[start_id]
+        self.current_node = graph.nodes[self.current_idx]
         self.event_callback = event_callback
         self.choice_index = 0
 
         self._dispatch_enter_event(self.current_node)
 
-    @property
-    def current_node(self) -> DialogueNode:
-        return self.nodes[self.current_id]
-
     def move_choice(self, offset: int) -> None:
         node = self.current_node
         if not node.has_choices():
@@ -64,22 +99,23 @@ class DialogueSession:
             choice = node.choices[self.choice_index]
             if self.event_callback and choice.event:
                 self.event_callback(choice.event, {"node_id": node.node_id})
-            next_id = choice.next_id
+            next_idx = choice.next_idx
         else:
-            next_id = node.next_id
-            if self.event_callback and node.exit_event:
-                self.event_callback(node.exit_event, {"node_id": node.node_id})
+            graph = self.graph
+            next_idx = graph.next_idx[self.current_idx]
+            exit_event = graph.exit_events[self.current_idx]
+            if self.event_callback and exit_event:
+                self.event_callback(exit_event, {"node_id": node.node_id})
 
-        if next_id is None:
+        if next_idx < 0:
             # Dialogue finished.
             return True
 
-        if next_id not in self.nodes:
-            raise ValueError(f"Dialogue node '{next_id}' not found.")
-
-        self.current_id = next_id
+        next_node = self.graph.nodes[next_idx]
+        self.current_idx = next_idx
+        self.current_node = next_node
         self.choice_index = 0
-        self._dispatch_enter_event(self.current_node)
+        self._dispatch_enter_event(next_node)
         return False
 
     def cancel(self) -> None:
@@ -96,15 +132,41 @@ class DialogueManager:
     """Registry of dialogue graphs."""
 
     def __init__(self, event_callback: DialogueEventCallback | None = None) -> None:
-        self.dialogues: dict[str, dict[str, DialogueNode]] = {}
+        self.dialogues: dict[str, DialogueGraph] = {}
         self.event_callback = event_callback
 
     def register(self, dialogue_id: str, nodes: Iterable[DialogueNode]) -> None:
-        mapping = {node.node_id: node for node in nodes}
-        self.dialogues[dialogue_id] = mapping
+        mapping: dict[str, DialogueNode] = {}
+        for node in nodes:
+            # Interned ids and event names let lookups short-circuit on identity.
+            node.node_id = sys.intern(node.node_id)
+            if node.next_id is not None:
+                node.next_id = sys.intern(node.next_id)
+            if node.enter_event is not None:
+                node.enter_event = sys.intern(node.enter_event)
+            if node.exit_event is not None:
+                node.exit_event = sys.intern(node.exit_event)
+            for choice in node.choices:
+                if choice.next_id is not None:
+                    choice.next_id = sys.intern(choice.next_id)
+                if choice.event is not None:
+                    choice.event = sys.intern(choice.event)
+            node.has_choices_flag = bool(node.choices)
+            mapping[node.node_id] = node
+        # Later duplicates of a node id replace earlier ones, as before.
+        self.dialogues[dialogue_id] = DialogueGraph(mapping.values())
+
+    def register_bulk(self, dialogues: Mapping[str, Iterable[DialogueNode]]) -> None:
+        """Register several dialogues; the node objects are shared, not copied."""
+        for dialogue_id, nodes in dialogues.items():
+            self.register(dialogue_id, nodes)
 
     def start(self, dialogue_id: str, start_node: str = "root") -> DialogueSession:
+        return self.factory(dialogue_id)(start_node)
+
+    def factory(self, dialogue_id: str) -> Callable[[str], DialogueSession]:
+        """Return a callable that starts ``dialogue_id`` at a given node."""
         if dialogue_id not in self.dialogues:
             raise ValueError(f"Dialogue '{dialogue_id}' not registered.")
-        return DialogueSession(self.dialogues[dialogue_id], start_node, self.event_callback)
+        return partial(DialogueSession, self.dialogues[dialogue_id], event_callback=self.event_callback)
 
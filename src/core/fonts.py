@@ -0,0 +1,12 @@
+from __future__ import annotations
+
+from functools import lru_cache
+
+import pygame
+
+
+@lru_cache(maxsize=32)
+def get_font(size: int, name: str | None = None) -> pygame.font.Font:
+    """Return a shared Font; ``name`` is a system font resolved via match_font."""
+    path = pygame.font.match_font(name) if name else None
+    return pygame.font.Font(path, size)
@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import pygame
+
+
+KEY_BITS: dict[int, int] = {
+    pygame.K_LEFT: 1 << 0,
+    pygame.K_a: 1 << 1,
+    pygame.K_RIGHT: 1 << 2,
+    pygame.K_d: 1 << 3,
+    pygame.K_UP: 1 << 4,
+    pygame.K_w: 1 << 5,
+    pygame.K_DOWN: 1 << 6,
+    pygame.K_s: 1 << 7,
+}
+
+LEFT_MASK = KEY_BITS[pygame.K_LEFT] | KEY_BITS[pygame.K_a]
+RIGHT_MASK = KEY_BITS[pygame.K_RIGHT] | KEY_BITS[pygame.K_d]
+UP_MASK = KEY_BITS[pygame.K_UP] | KEY_BITS[pygame.K_w]
+DOWN_MASK = KEY_BITS[pygame.K_DOWN] | KEY_BITS[pygame.K_s]
+
+
+class InputState:
+    """Bitmask of held movement keys, kept in sync from the event queue."""
+
+    pressed: int = 0
+
+    @classmethod
+    def handle_event(cls, event: pygame.event.Event) -> None:
+        if event.type == pygame.KEYDOWN:
+            cls.pressed |= KEY_BITS.get(event.key, 0)
+        elif event.type == pygame.KEYUP:
+            cls.pressed &= ~KEY_BITS.get(event.key, 0)
+        elif event.type == pygame.WINDOWFOCUSLOST:
+            # KEYUP events are not delivered while unfocused.
+            cls.pressed = 0
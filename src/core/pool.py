@@ -0,0 +1,9 @@
+from __future__ import annotations
+
+import pygame
+
+
+# Scratch object for per-frame temporaries, mutated in place with update()
+# instead of allocating. A value held in it must not outlive the call that
+# filled it, and it is only safe to use from the main (render) thread.
+SCRATCH_RECT = pygame.Rect(0, 0, 0, 0)
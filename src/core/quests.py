@@ -5,19 +5,37 @@ from dataclasses import dataclass, field
 from core.settings import QUEST_FIND_ARTIFACTS
 
 
-@dataclass
+@dataclass(slots=True)
 class QuestState:
     quest_id: str
     description: str
     items_required: int
-    items_collected: set[str] = field(default_factory=set)
+    # Each distinct item id is assigned its own bit the first time it is seen.
+    item_bits: dict[str, int] = field(default_factory=dict)
+    collected_mask: int = 0
     completed: bool = False
+    # Tracker line with everything but the collected count filled in.
+    status_template: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        description = self.description.replace("{", "{{").replace("}", "}}")
+        self.status_template = f"Quest: {description} ({{}}/{self.items_required})"
+
+    def status_text(self) -> str:
+        return self.status_template.format(self.collected_count)
+
+    @property
+    def collected_count(self) -> int:
+        return self.collected_mask.bit_count()
 
     def record_item(self, object_id: str) -> None:
-        if not self.completed:
-            self.items_collected.add(object_id)
-            if len(self.items_collected) >= self.items_required:
-                self.completed = True
+        if self.completed:
+            return
+        bit = self.item_bits.get(object_id)
+        if bit is None:
+            bit = self.item_bits[object_id] = 1 << len(self.item_bits)
+        self.collected_mask |= bit
+        self.completed = self.collected_mask.bit_count() >= self.items_required
 
 
 class QuestManager:
@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from typing import Sequence
+
+import pygame
+
+
+# fblits arrived in pygame-ce; classic pygame only has blits.
+HAS_FBLITS = hasattr(pygame.Surface, "fblits")
+
+
+def blit_many(
+    target: pygame.Surface,
+    pairs: Sequence[tuple[pygame.Surface, tuple[int, int]]],
+) -> None:
+    """Blit ``(surface, position)`` pairs, in order, with a single call."""
+    if HAS_FBLITS:
+        target.fblits(pairs)
+    else:
+        target.blits(pairs, doreturn=False)
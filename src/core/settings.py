@@ -1,8 +1,18 @@
 SCREEN_WIDTH = 800
 SCREEN_HEIGHT = 600
 FPS = 60
+# Simulation runs in fixed steps; frames that fall further behind than
+# MAX_UPDATES_PER_FRAME steps drop the excess instead of spiralling.
+DT_FIXED = 1 / FPS
+MAX_UPDATES_PER_FRAME = 5
 
 TILE_SIZE = 16
+# Grid cell size for the interactable lookup.
+INTERACTABLE_CELL_SIZE = 32
+# Coalesced colliders are large, so their grid uses coarser cells.
+COLLIDER_CELL_SIZE = 64
+# Keep rendered TMX maps in .cache/ so later runs skip the tile blitting.
+MAP_CACHE_ENABLED = True
 
 RENDER_SCALE = 2
 VIEW_WIDTH = SCREEN_WIDTH // RENDER_SCALE
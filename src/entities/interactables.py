@@ -5,6 +5,8 @@ from typing import Protocol
 
 import pygame
 
+from entities.sprite_sheet import load_sprite_sheet
+
 
 ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
 DEFAULT_NPC_SPRITE = ASSETS_DIR / "characters" / "cloaked-figure.png"
@@ -19,24 +21,49 @@ class PlayStateLike(Protocol):
 
 
 class Interactable:
+    __slots__ = ("object_id", "_rect", "_hit_rect", "enabled")
+
     def __init__(self, object_id: str, rect: pygame.Rect) -> None:
         self.object_id = object_id
         self.rect = rect
         self.enabled = True
 
-    def can_interact(self, player_rect: pygame.Rect) -> bool:
-        return self.enabled and self.rect.inflate(12, 12).colliderect(player_rect)
+    @property
+    def rect(self) -> pygame.Rect:
+        return self._rect
+
+    @rect.setter
+    def rect(self, rect: pygame.Rect) -> None:
+        # Assign a new rect rather than mutating in place so the cached
+        # interaction area stays in sync.
+        self._rect = rect
+        self._hit_rect = rect.inflate(12, 12)
+
+    @property
+    def hit_rect(self) -> pygame.Rect:
+        """Area in which the player can trigger this interactable."""
+        return self._hit_rect
 
     def interact(self, play_state: PlayStateLike) -> None:
         raise NotImplementedError
 
-    def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2) -> None:
+    def draw(self, surface: pygame.Surface, ox: int, oy: int) -> None:
         # Placeholder visual representation
-        draw_rect = self.rect.move(-camera_offset.x, -camera_offset.y)
-        pygame.draw.rect(surface, (180, 180, 180), draw_rect, width=1)
+        rect = self._rect
+        pygame.draw.rect(surface, (180, 180, 180), (rect.x + ox, rect.y + oy, rect.w, rect.h), width=1)
 
 
 class NPC(Interactable):
+    __slots__ = (
+        "dialogue_id",
+        "sprite_path",
+        "sprite_columns",
+        "sprite_rows",
+        "_sprite",
+        "_sprite_half_width",
+        "_sprite_height",
+    )
+
     _sprite_cache: dict[tuple[Path, int, int], pygame.Surface] = {}
 
     def __init__(
@@ -54,6 +81,9 @@ class NPC(Interactable):
         self.sprite_path = sprite_path if sprite_path is not None else DEFAULT_NPC_SPRITE
         self.sprite_columns = sprite_columns
         self.sprite_rows = sprite_rows
+        self._sprite = self._load_sprite(self.sprite_path, sprite_columns, sprite_rows)
+        self._sprite_half_width = self._sprite.get_width() // 2
+        self._sprite_height = self._sprite.get_height()
 
     def set_dialogue(self, dialogue_id: str) -> None:
         self.dialogue_id = dialogue_id
@@ -61,11 +91,16 @@ class NPC(Interactable):
     def interact(self, play_state: PlayStateLike) -> None:
         play_state.begin_dialogue(self.dialogue_id)
 
-    def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2) -> None:
-        sprite = self._load_sprite(self.sprite_path, self.sprite_columns, self.sprite_rows)
-        world_rect = self.rect.move(-camera_offset.x, -camera_offset.y)
-        sprite_rect = sprite.get_rect(midbottom=world_rect.midbottom)
-        surface.blit(sprite, sprite_rect)
+    def draw(self, surface: pygame.Surface, ox: int, oy: int) -> None:
+        surface.blit(*self.get_blit_tuple(ox, oy))
+
+    def get_blit_tuple(self, ox: int, oy: int) -> tuple[pygame.Surface, tuple[int, int]]:
+        """Return a ``(sprite, dest)`` pair for batching with ``Surface.blits``."""
+        rect = self._rect
+        return self._sprite, (
+            rect.centerx + ox - self._sprite_half_width,
+            rect.bottom + oy - self._sprite_height,
+        )
 
     @classmethod
     def _load_sprite(cls, path: Path, columns: int, rows: int) -> pygame.Surface:
@@ -74,7 +109,7 @@ class NPC(Interactable):
         if sprite is None:
             if not path.exists():
                 raise FileNotFoundError(f"NPC sprite not found at {path}")
-            sheet = pygame.image.load(str(path)).convert_alpha()
+            sheet = load_sprite_sheet(path)
             frame_width = sheet.get_width() // columns
             frame_height = sheet.get_height() // rows
             sprite = sheet.subsurface(pygame.Rect(0, 0, frame_width, frame_height)).copy()
@@ -83,6 +118,8 @@ class NPC(Interactable):
 
 
 class DoorInteractable(Interactable):
+    __slots__ = ("target_map", "target_spawn", "dialogue_id")
+
     def __init__(
         self,
         object_id: str,
@@ -101,12 +138,14 @@ class DoorInteractable(Interactable):
             play_state.begin_dialogue(self.dialogue_id)
         play_state.request_map_change(self.target_map, self.target_spawn)
 
-    def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2) -> None:
+    def draw(self, surface: pygame.Surface, ox: int, oy: int) -> None:
         # Doors are represented by map artwork; no additional overlay needed.
         return
 
 
 class QuestItem(Interactable):
+    __slots__ = ("dialogue_id", "quest_event", "visible", "color")
+
     def __init__(
         self,
         object_id: str,
@@ -127,15 +166,17 @@ class QuestItem(Interactable):
         play_state.notify_event(self.quest_event, {"object_id": self.object_id})
         self.enabled = False
 
-    def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2) -> None:
+    def draw(self, surface: pygame.Surface, ox: int, oy: int) -> None:
         if not self.visible:
             return
-        draw_rect = self.rect.move(-camera_offset.x, -camera_offset.y)
-        pygame.draw.rect(surface, self.color, draw_rect)
+        rect = self._rect
+        pygame.draw.rect(surface, self.color, (rect.x + ox, rect.y + oy, rect.w, rect.h))
         return
 
 
 class LoreObject(Interactable):
+    __slots__ = ("dialogue_id", "visible", "color")
+
     def __init__(
         self,
         object_id: str,
@@ -152,9 +193,9 @@ class LoreObject(Interactable):
     def interact(self, play_state: PlayStateLike) -> None:
         play_state.begin_dialogue(self.dialogue_id)
 
-    def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2) -> None:
+    def draw(self, surface: pygame.Surface, ox: int, oy: int) -> None:
         if not self.visible:
             return
-        draw_rect = self.rect.move(-camera_offset.x, -camera_offset.y)
-        pygame.draw.rect(surface, self.color, draw_rect)
+        rect = self._rect
+        pygame.draw.rect(surface, self.color, (rect.x + ox, rect.y + oy, rect.w, rect.h))
 
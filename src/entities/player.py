@@ -1,13 +1,27 @@
 from __future__ import annotations
 
+import math
 from pathlib import Path
+from typing import Callable
 
 import pygame
 
+from core.input_state import DOWN_MASK, LEFT_MASK, RIGHT_MASK, UP_MASK, InputState
+from core.settings import DT_FIXED
+from entities.sprite_sheet import load_sprite_sheet
+
 
 ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
 PLAYER_SPRITE_PATH = ASSETS_DIR / "characters" / "dayana.png"
 
+_DIAGONAL = 1 / math.sqrt(2)
+# Unit movement vector for every (x, y) input sign pair.
+_DIR_TABLE: dict[tuple[int, int], tuple[float, float]] = {
+    (x, y): (x * _DIAGONAL, y * _DIAGONAL) if x and y else (float(x), float(y))
+    for x in (-1, 0, 1)
+    for y in (-1, 0, 1)
+}
+
 
 class Player:
     _sheet: pygame.Surface | None = None
@@ -25,8 +39,11 @@ class Player:
         self.animations = self._load_animations()
         self.facing = "down"
         self.walk_sequence_index = 0
-        self.animation_timer = 0.0
         self.animation_speed = 0.12
+        # Updates run at DT_FIXED, so count steps instead of summing seconds.
+        # ceil matches the old ``timer >= animation_speed`` threshold.
+        self.frames_per_step = math.ceil(self.animation_speed / DT_FIXED)
+        self.animation_frames = 0
 
         starting_sprite = self.animations[self.facing][self.IDLE_INDEX]
         self.rect = pygame.Rect(
@@ -36,50 +53,69 @@ class Player:
             self.COLLISION_HEIGHT,
         )
         self.pos = pygame.Vector2(self.rect.topleft)
-        self.sprite_offset = pygame.Vector2(
-            (starting_sprite.get_width() - self.COLLISION_WIDTH) / 2,
-            starting_sprite.get_height() - self.COLLISION_HEIGHT,
-        )
+        # Whether the last update left the rect somewhere new; compared
+        # against where the previous update ended so teleports count too.
+        self.moved_this_frame = True
+        self._last_topleft = self.rect.topleft
+        # Every frame is cut from the same grid, so this never changes.
+        self.sprite_offset_x = (starting_sprite.get_width() - self.COLLISION_WIDTH) // 2
+        self.sprite_offset_y = starting_sprite.get_height() - self.COLLISION_HEIGHT
 
         self.input_vector = pygame.Vector2(0, 0)
         self.direction = pygame.Vector2(0, 0)
         self.sprite = starting_sprite
 
-    def handle_input(self) -> None:
-        keys = pygame.key.get_pressed()
-        vector = pygame.Vector2(0, 0)
-
-        if keys[pygame.K_LEFT] or keys[pygame.K_a]:
-            vector.x = -1
-        elif keys[pygame.K_RIGHT] or keys[pygame.K_d]:
-            vector.x = 1
-
-        if keys[pygame.K_UP] or keys[pygame.K_w]:
-            vector.y = -1
-        elif keys[pygame.K_DOWN] or keys[pygame.K_s]:
-            vector.y = 1
-
-        self.input_vector = vector
-        if vector.length_squared() > 0:
-            self.direction = vector.normalize()
-            self._update_facing(vector)
-        else:
-            self.direction.update(0, 0)
+    def reset(self, spawn_position: tuple[int, int]) -> None:
+        """Put the player back in its freshly spawned state at ``spawn_position``."""
+        self.rect.topleft = spawn_position
+        self.pos.update(self.rect.topleft)
+        self.moved_this_frame = True
+        self._last_topleft = self.rect.topleft
+        self.input_vector.update(0, 0)
+        self.direction.update(0, 0)
+        self.facing = "down"
+        self.walk_sequence_index = 0
+        self.animation_frames = 0
+        self.sprite = self.animations[self.facing][self.IDLE_INDEX]
 
-    def update(self, dt: float, colliders: list[pygame.Rect], bounds: pygame.Rect) -> None:
+    def handle_input(self) -> None:
+        pressed = InputState.pressed
+        x = ((pressed & RIGHT_MASK) != 0) - ((pressed & LEFT_MASK) != 0)
+        y = ((pressed & DOWN_MASK) != 0) - ((pressed & UP_MASK) != 0)
+
+        self.input_vector.update(x, y)
+        self.direction.update(_DIR_TABLE[(x, y)])
+        if x or y:
+            self._update_facing(x, y)
+
+    def update(
+        self,
+        dt: float,
+        query_colliders: Callable[[pygame.Rect], list[pygame.Rect]],
+        bounds: pygame.Rect,
+    ) -> None:
         self.handle_input()
 
-        velocity = self.direction * self.speed * dt
-        self._move(velocity.x, 0, colliders)
-        self._move(0, velocity.y, colliders)
+        # Plain float math; a scaled Vector2 here would allocate every frame.
+        direction = self.direction
+        self._move(direction.x * self.speed * dt, 0, query_colliders)
+        self._move(0, direction.y * self.speed * dt, query_colliders)
 
         self.rect.clamp_ip(bounds)
         self.pos.update(self.rect.topleft)
-
-        moving = self.input_vector.length_squared() > 0
-        self._update_animation(dt, moving)
-
-    def _move(self, dx: float, dy: float, colliders: list[pygame.Rect]) -> None:
+        topleft = self.rect.topleft
+        self.moved_this_frame = topleft != self._last_topleft
+        self._last_topleft = topleft
+
+        moving = self.input_vector.x != 0 or self.input_vector.y != 0
+        self._update_animation(moving)
+
+    def _move(
+        self,
+        dx: float,
+        dy: float,
+        query_colliders: Callable[[pygame.Rect], list[pygame.Rect]],
+    ) -> None:
         if dx == 0 and dy == 0:
             return
 
@@ -87,54 +123,64 @@ class Player:
         self.pos.y += dy
         self.rect.topleft = (round(self.pos.x), round(self.pos.y))
 
-        for collider in colliders:
-            if self.rect.colliderect(collider):
-                if dx > 0:
-                    self.rect.right = collider.left
-                if dx < 0:
-                    self.rect.left = collider.right
-                if dy > 0:
-                    self.rect.bottom = collider.top
-                if dy < 0:
-                    self.rect.top = collider.bottom
-                self.pos.update(self.rect.topleft)
-
-    def _update_facing(self, vector: pygame.Vector2) -> None:
-        if abs(vector.x) > abs(vector.y):
-            self.facing = "right" if vector.x > 0 else "left"
+        rect = self.rect
+        candidates = query_colliders(rect)
+        if not candidates:
+            return
+
+        index = rect.collidelist(candidates)
+        if index == -1:
+            # Common case: nothing nearby overlaps, the move stands as is.
+            return
+
+        # Each resolution pushes the rect back along the movement axis, so
+        # re-testing the candidates fetched above (no new query) until none
+        # overlaps always terminates.
+        while index != -1:
+            collider = candidates[index]
+            if dx > 0:
+                rect.right = collider.left
+            if dx < 0:
+                rect.left = collider.right
+            if dy > 0:
+                rect.bottom = collider.top
+            if dy < 0:
+                rect.top = collider.bottom
+            self.pos.update(rect.topleft)
+            index = rect.collidelist(candidates)
+
+    def _update_facing(self, x: int, y: int) -> None:
+        if abs(x) > abs(y):
+            self.facing = "right" if x > 0 else "left"
         else:
-            self.facing = "down" if vector.y > 0 else "up"
+            self.facing = "down" if y > 0 else "up"
 
-    def _update_animation(self, dt: float, moving: bool) -> None:
+    def _update_animation(self, moving: bool) -> None:
         frames = self.animations[self.facing]
         if moving:
-            self.animation_timer += dt
-            if self.animation_timer >= self.animation_speed:
-                self.animation_timer = 0.0
+            self.animation_frames += 1
+            if self.animation_frames >= self.frames_per_step:
+                self.animation_frames = 0
                 self.walk_sequence_index = (self.walk_sequence_index + 1) % len(self.WALK_SEQUENCE)
             frame_index = self.WALK_SEQUENCE[self.walk_sequence_index]
         else:
             self.walk_sequence_index = 0
             frame_index = self.IDLE_INDEX
-            self.animation_timer = 0.0
+            self.animation_frames = 0
 
         self.sprite = frames[frame_index]
-        self.sprite_offset.update(
-            (self.sprite.get_width() - self.COLLISION_WIDTH) / 2,
-            self.sprite.get_height() - self.COLLISION_HEIGHT,
-        )
 
     def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2) -> None:
-        draw_pos = pygame.Vector2(self.rect.topleft) - pygame.Vector2(camera_offset)
-        draw_pos -= self.sprite_offset
-        surface.blit(self.sprite, (round(draw_pos.x), round(draw_pos.y)))
+        draw_x = self.rect.x - int(camera_offset.x) - self.sprite_offset_x
+        draw_y = self.rect.y - int(camera_offset.y) - self.sprite_offset_y
+        surface.blit(self.sprite, (draw_x, draw_y))
 
     @classmethod
     def _load_sheet(cls) -> pygame.Surface:
         if cls._sheet is None:
             if not PLAYER_SPRITE_PATH.exists():
                 raise FileNotFoundError(f"Player sprite not found at {PLAYER_SPRITE_PATH}")
-            cls._sheet = pygame.image.load(str(PLAYER_SPRITE_PATH)).convert_alpha()
+            cls._sheet = load_sprite_sheet(PLAYER_SPRITE_PATH)
         return cls._sheet
 
     @classmethod
@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pygame
+
+
+SPRITE_COLORKEY = (255, 0, 255)
+
+# Sheet file names whose art uses partial transparency and therefore has to
+# keep per-pixel alpha. Everything else only has fully clear or fully opaque
+# pixels, which a colorkey reproduces at a fraction of the blit cost.
+ALPHA_SPRITES: frozenset[str] = frozenset()
+
+
+def load_sprite_sheet(path: Path) -> pygame.Surface:
+    """Load a character sheet in the display format, colorkeyed when possible."""
+    image = pygame.image.load(str(path))
+    if path.name in ALPHA_SPRITES:
+        return image.convert_alpha()
+
+    # Transparent pixels carry arbitrary RGB values, so flatten them onto the
+    # key color rather than keying on whatever the PNG stored.
+    sheet = pygame.Surface(image.get_size()).convert()
+    sheet.fill(SPRITE_COLORKEY)
+    sheet.blit(image, (0, 0))
+    sheet.set_colorkey(SPRITE_COLORKEY, pygame.RLEACCEL)
+    return sheet
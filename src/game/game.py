@@ -4,7 +4,17 @@ from typing import TYPE_CHECKING
 
 import pygame
 
-from core.settings import FPS, RENDER_SCALE, SCREEN_HEIGHT, SCREEN_WIDTH, VIEW_HEIGHT, VIEW_WIDTH
+from core.input_state import InputState
+from core.settings import (
+    DT_FIXED,
+    FPS,
+    MAX_UPDATES_PER_FRAME,
+    RENDER_SCALE,
+    SCREEN_HEIGHT,
+    SCREEN_WIDTH,
+    VIEW_HEIGHT,
+    VIEW_WIDTH,
+)
 from states.main_menu import MainMenuState
 
 if TYPE_CHECKING:
@@ -22,6 +32,9 @@ class Game:
         self.render_scale = RENDER_SCALE
         self.view_size = (VIEW_WIDTH, VIEW_HEIGHT)
         self.render_surface = pygame.Surface(self.view_size).convert_alpha()
+        # transform.scale writes into this each frame; it must share the
+        # render surface's pixel format.
+        self._scaled = pygame.Surface(self.screen.get_size()).convert_alpha()
         self.clock = pygame.time.Clock()
 
         self.states: dict[str, type["GameState"]] = {}
@@ -58,10 +71,14 @@ class Game:
             self.state_stack.pop().exit()
 
     def run(self) -> None:
+        accumulator = 0.0
         while self.running:
-            dt = self.clock.tick(FPS) / 1000.0
+            accumulator += self.clock.tick(FPS) / 1000.0
+            accumulator = min(accumulator, DT_FIXED * MAX_UPDATES_PER_FRAME)
             self._handle_events()
-            self._update(dt)
+            while accumulator >= DT_FIXED:
+                self._update(DT_FIXED)
+                accumulator -= DT_FIXED
             self._draw()
 
         pygame.quit()
@@ -72,6 +89,10 @@ class Game:
                 self.running = False
                 return
 
+            if event.type == pygame.VIDEORESIZE:
+                self._scaled = pygame.Surface(self.screen.get_size()).convert_alpha()
+
+            InputState.handle_event(event)
             if self.state_stack:
                 self.state_stack[-1].handle_event(event)
 
@@ -83,7 +104,7 @@ class Game:
         if self.state_stack:
             self.render_surface.fill((0, 0, 0))
             self.state_stack[-1].draw(self.render_surface)
-            scaled = pygame.transform.scale(self.render_surface, self.screen.get_size())
-            self.screen.blit(scaled, (0, 0))
+            pygame.transform.scale(self.render_surface, self._scaled.get_size(), self._scaled)
+            self.screen.blit(self._scaled, (0, 0))
             pygame.display.flip()
 
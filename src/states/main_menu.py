@@ -2,6 +2,7 @@ from __future__ import annotations
 
 import pygame
 
+from core.fonts import get_font
 from core.settings import MENU_FONT_SIZE, MENU_SELECTED_COLOR, MENU_UNSELECTED_COLOR
 from core.state import GameState
 from states.play_state import PlayState
@@ -12,7 +13,13 @@ class MainMenuState(GameState):
         super().__init__(game)
         self.options = ["Play Game", "Quit Game"]
         self.selected_index = 0
-        self.font = pygame.font.Font(None, MENU_FONT_SIZE)
+        self.font = get_font(MENU_FONT_SIZE)
+
+        self._title_surface: pygame.Surface | None = None
+        self._title_rect = pygame.Rect(0, 0, 0, 0)
+        # (unselected, selected) renders per option, sharing one rect each.
+        self._option_surfaces: list[tuple[pygame.Surface, pygame.Surface]] = []
+        self._option_rects: list[pygame.Rect] = []
 
         # Ensure play state is registered exactly once
         if "play" not in self.game.states:
@@ -20,6 +27,20 @@ class MainMenuState(GameState):
 
     def enter(self, previous_state: str | None = None) -> None:
         self.selected_index = 0
+        self._render_text()
+
+    def _render_text(self) -> None:
+        width, height = self.game.view_size
+        self._title_surface = get_font(MENU_FONT_SIZE + 12).render("Monsters & Maps", True, (255, 255, 255))
+        self._title_rect = self._title_surface.get_rect(center=(width // 2, height // 4))
+
+        self._option_surfaces = []
+        self._option_rects = []
+        for idx, option in enumerate(self.options):
+            unselected = self.font.render(option, True, MENU_UNSELECTED_COLOR)
+            selected = self.font.render(option, True, MENU_SELECTED_COLOR)
+            self._option_surfaces.append((unselected, selected))
+            self._option_rects.append(unselected.get_rect(center=(width // 2, height // 2 + idx * 40)))
 
     def handle_event(self, event: pygame.event.Event) -> None:
         if event.type == pygame.KEYDOWN:
@@ -43,15 +64,7 @@ class MainMenuState(GameState):
     def draw(self, surface: pygame.Surface) -> None:
         surface.fill((0, 0, 0))
 
-        width, height = surface.get_size()
-        title_font = pygame.font.Font(None, MENU_FONT_SIZE + 12)
-        title_surface = title_font.render("Monsters & Maps", True, (255, 255, 255))
-        title_rect = title_surface.get_rect(center=(width // 2, height // 4))
-        surface.blit(title_surface, title_rect)
-
-        for idx, option in enumerate(self.options):
-            color = MENU_SELECTED_COLOR if idx == self.selected_index else MENU_UNSELECTED_COLOR
-            text_surface = self.font.render(option, True, color)
-            text_rect = text_surface.get_rect(center=(width // 2, height // 2 + idx * 40))
-            surface.blit(text_surface, text_rect)
+        surface.blit(self._title_surface, self._title_rect)
 
+        for idx, surfaces in enumerate(self._option_surfaces):
+            surface.blit(surfaces[1 if idx == self.selected_index else 0], self._option_rects[idx])
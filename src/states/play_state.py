@@ -1,11 +1,15 @@
 from __future__ import annotations
 
+import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable
 
 import pygame
 
 from core.dialogue import DialogueChoice, DialogueManager, DialogueNode, DialogueSession
+from core.fonts import get_font
 from core.quests import QuestManager
 from core.settings import (
     MAP_INTERIOR_HOME,
@@ -22,10 +26,36 @@ from world.map_manager import MapManager
 
 if TYPE_CHECKING:
     from game.game import Game
-    from world.map_manager import GameMap
+    from world.map_manager import GameMap, PendingMap
 
 
 ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+INTERACT_PROMPT = "Press [E] to Interact"
+# Story event names, interned so handler lookups match on identity.
+EV_TRAVEL_TO_FOREST = sys.intern("travel_to_forest")
+EV_QUEST_BEGIN = sys.intern("quest_begin")
+EV_QUEST_TURN_IN = sys.intern("quest_turn_in")
+EV_FLOWER_FOUND = sys.intern("flower_found")
+EV_SALLY_COMPLETE = sys.intern("sally_complete")
+EV_SHOW_ENDING = sys.intern("show_ending")
+EV_HOME_INTRO_END = sys.intern("home_intro_end")
+EV_FISHER_STORY_STAGE1 = sys.intern("fisher_story_stage1")
+EV_FISHER_STORY_STAGE2_DONE = sys.intern("fisher_story_stage2_done")
+EV_FISHER_STORY_REWARD = sys.intern("fisher_story_reward")
+EV_MIA_BEGIN_TRANSFORMATION = sys.intern("mia_begin_transformation")
+
+END_TITLE_LINES = (
+    "The Heart Gem shines brightest",
+    "when it's shared.",
+)
+END_MESSAGE_LINES = (
+    "You completed the Quest for the Heart Gem!",
+    "A new adventure begins — together.",
+    "",
+    "The Heart Gem shines brightest when it’s shared.",
+    "",
+    "Press Enter to return to the main menu.",
+)
 
 
 class PlayState(GameState):
@@ -36,34 +66,67 @@ class PlayState(GameState):
         self.player = Player(spawn)
         self.camera = pygame.Vector2()
         self.view_width, self.view_height = self.game.view_size
+        self._camera_max_x = 0
+        self._camera_max_y = 0
+        self._refresh_camera_bounds()
 
         self.dialogue_manager = DialogueManager(event_callback=self.notify_event)
         self.dialogue_box = DialogueBox()
         self.active_dialogue: DialogueSession | None = None
 
-        self.font = pygame.font.Font(None, 18)
-        self.quest_font = pygame.font.Font(None, 16)
-        self.end_title_font = pygame.font.Font(None, 32)
-        self.end_message_font = pygame.font.Font(None, 20)
+        self.font = get_font(18)
+        self.quest_font = get_font(16)
+        self.end_title_font = get_font(32)
+        self.end_message_font = get_font(20)
+        self._end_title_surfaces = [
+            self.end_title_font.render(line, True, (255, 255, 255)) for line in END_TITLE_LINES
+        ]
+        self._end_message_surfaces = [
+            self.end_message_font.render(line, True, (220, 220, 220)) for line in END_MESSAGE_LINES
+        ]
 
         self.quest_manager = QuestManager()
-        self.pending_map_change: tuple[str, tuple[int, int]] | None = None
-
-        self.current_prompt: str | None = None
+        # Maps are prepared off the main thread and swapped in once ready.
+        self._map_loader = ThreadPoolExecutor(max_workers=1, thread_name_prefix="map-loader")
+        self._load_future: Future["PendingMap"] | None = None
+        self._loading_surface = self.font.render("Loading...", True, (255, 255, 255))
+
+        # Frames are only re-rendered when something visible may have
+        # changed; otherwise the previous one is blitted back.
+        self._dirty = True
+        self._last_frame: pygame.Surface | None = None
+        self._last_view_key: tuple | None = None
+
+        self._current_prompt: str | None = None
+        self._prompt_surface: pygame.Surface | None = None
         self.focus_interactable: Interactable | None = None
         self.end_screen_active = False
+        self._end_overlay: pygame.Surface | None = None
+        self._end_blits: list[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]] | None = None
         self.quest_tracker_visible = False
+        self._quest_tracker_key: tuple | None = None
+        self._quest_tracker_surface: pygame.Surface | None = None
         self.flash_timer = 0.0
         self.flash_duration = 0.35
+        self._flash_overlay: pygame.Surface | None = None
         self.aaron_spawned = False
 
         self._register_dialogues()
         self.begin_dialogue("home_intro")
 
     def enter(self, previous_state: str | None = None) -> None:
+        self._dirty = True
         self._update_camera()
 
+    def exit(self) -> None:
+        self._map_loader.shutdown(wait=False, cancel_futures=True)
+
     def handle_event(self, event: pygame.event.Event) -> None:
+        self._dirty = True
+        if event.type == pygame.VIDEORESIZE:
+            self._on_resize()
+            return
+
         if self.end_screen_active:
             if event.type == pygame.KEYDOWN and event.key in (
                 pygame.K_ESCAPE,
@@ -124,140 +187,215 @@ class PlayState(GameState):
         if self.end_screen_active:
             return
 
-        if not self.active_dialogue:
-            self.player.update(dt, self.map_manager.collision_rects, self.map_manager.map_rect)
+        # The player stays put while a map loads, so the swap never has to
+        # chase a player who wandered off on the old map.
+        if not self.active_dialogue and self._load_future is None:
+            self.player.update(dt, self.map_manager.query_colliders, self.map_manager.map_rect)
 
-        self._update_camera()
+        # Resizes refresh the camera in _on_resize, so only movement matters.
+        if self.player.moved_this_frame:
+            self._update_camera()
         self._update_focus_interactable()
 
-        if self.pending_map_change and not self.active_dialogue:
-            map_id, spawn = self.pending_map_change
-            spawn_pos = self.map_manager.load_map(map_id, spawn)
-            self.player = Player(spawn_pos)
-            self.pending_map_change = None
-            self._update_camera()
+        load_future = self._load_future
+        if load_future is not None:
+            # Keep redrawing while a load is in flight so the overlay tracks it.
+            self._dirty = True
+            if not self.active_dialogue and load_future.done():
+                # Surfaces and sprites are only ever created here, on the main thread.
+                game_map, spawn_pos = self.map_manager.finish_map(load_future.result())
+                self._load_future = None
+                self.map_manager.swap_to(game_map)
+                self.player.reset(spawn_pos)
+                self._refresh_camera_bounds()
+                self._update_camera()
 
         if self.flash_timer > 0:
             self.flash_timer = max(0.0, self.flash_timer - dt)
+            self._dirty = True
 
     def draw(self, surface: pygame.Surface) -> None:
+        player = self.player
+        # Player position and animation frame also pin down the camera.
+        view_key = (player.rect.x, player.rect.y, player.sprite)
+        if view_key != self._last_view_key:
+            self._last_view_key = view_key
+            self._dirty = True
+
+        last_frame = self._last_frame
+        if not self._dirty and last_frame is not None and last_frame.get_size() == surface.get_size():
+            surface.blit(last_frame, (0, 0))
+            return
+
+        self._render(surface)
+        if last_frame is None or last_frame.get_size() != surface.get_size():
+            self._last_frame = surface.copy()
+        else:
+            last_frame.blit(surface, (0, 0))
+        self._dirty = False
+
+    def _render(self, surface: pygame.Surface) -> None:
         surface.fill((0, 0, 0))
         self.map_manager.draw(surface, self.camera)
         self.player.draw(surface, self.camera)
 
+        # HUD text goes out in a single blits() call.
+        hud: list[tuple[pygame.Surface, tuple[int, int]]] = []
         if self.active_dialogue:
             self.dialogue_box.draw(surface, self.active_dialogue)
         elif not self.end_screen_active:
-            self._draw_prompt(surface)
-        self._draw_quest_tracker(surface)
+            self._queue_prompt(hud)
+        self._queue_quest_tracker(hud)
+        if hud:
+            surface.blits(hud, doreturn=False)
         self._draw_flash(surface)
         if self.end_screen_active:
             self._draw_end_screen(surface)
-
-    def _draw_prompt(self, surface: pygame.Surface) -> None:
-        if self.end_screen_active or not self.current_prompt:
+        elif self._load_future is not None and not self._load_future.done():
+            loading = self._loading_surface
+            surface.blit(loading, loading.get_rect(center=surface.get_rect().center))
+
+    @property
+    def current_prompt(self) -> str | None:
+        return self._current_prompt
+
+    @current_prompt.setter
+    def current_prompt(self, prompt: str | None) -> None:
+        if prompt != self._current_prompt:
+            self._current_prompt = prompt
+            self._prompt_surface = None
+            self._dirty = True
+
+    def _queue_prompt(self, blits: list[tuple[pygame.Surface, tuple[int, int]]]) -> None:
+        if self.end_screen_active or not self._current_prompt:
             return
-        prompt_surface = self.font.render(self.current_prompt, True, (255, 255, 255))
-        prompt_rect = prompt_surface.get_rect()
-        surface.blit(
-            prompt_surface,
-            (self.view_width - prompt_rect.width - 10, self.view_height - prompt_rect.height - 10),
+        if self._prompt_surface is None:
+            self._prompt_surface = self.font.render(self._current_prompt, True, (255, 255, 255))
+        prompt_surface = self._prompt_surface
+        blits.append(
+            (
+                prompt_surface,
+                (
+                    self.view_width - prompt_surface.get_width() - 10,
+                    self.view_height - prompt_surface.get_height() - 10,
+                ),
+            )
         )
 
     def begin_dialogue(self, dialogue_id: str, start_node: str | None = None) -> None:
-        self.active_dialogue = self.dialogue_manager.start(dialogue_id, start_node or "root")
+        self._dirty = True
+        factory = self._dialogue_factories.get(dialogue_id)
+        if factory is None:
+            # Not registered up front; let the manager resolve or reject it.
+            factory = self.dialogue_manager.factory(dialogue_id)
+        self.active_dialogue = factory(start_node or "root")
 
     def request_map_change(self, map_id: str, spawn: tuple[int, int]) -> None:
-        self.pending_map_change = (map_id, spawn)
+        if self._load_future is not None:
+            # The first destination wins; nothing can be entered mid-load.
+            return
+        self._load_future = self._map_loader.submit(self.map_manager.prepare_map, map_id, spawn)
+
+    # Story events handled by the state itself; anything else goes to the
+    # quest manager. Values are method names so subclasses can override them.
+    _EVENT_HANDLERS: dict[str, str] = {
+        EV_TRAVEL_TO_FOREST: "_handle_travel_to_forest",
+        EV_QUEST_BEGIN: "_handle_quest_begin",
+        EV_QUEST_TURN_IN: "_handle_quest_turn_in",
+        EV_FLOWER_FOUND: "_handle_flower_found",
+        EV_SALLY_COMPLETE: "_handle_sally_complete",
+        EV_SHOW_ENDING: "_handle_show_ending",
+        EV_HOME_INTRO_END: "_handle_home_intro_end",
+        EV_FISHER_STORY_STAGE1: "_handle_fisher_story_stage1",
+        EV_FISHER_STORY_STAGE2_DONE: "_handle_fisher_story_stage2_done",
+        EV_FISHER_STORY_REWARD: "_handle_fisher_story_reward",
+        EV_MIA_BEGIN_TRANSFORMATION: "_handle_mia_begin_transformation",
+    }
 
     def notify_event(self, event_name: str, payload: dict | None = None) -> None:
         payload = payload or {}
+        self._dirty = True
 
-        if event_name == "travel_to_forest":
-            self.request_map_change(MAP_OUTSIDE_FOREST, (900, 1100))
-            return
-
-        if event_name == "quest_begin":
-            self.current_prompt = "Collect the three Heart Shards the cloaked figure described."
-            self.quest_tracker_visible = True
-            return
-
-        if event_name == "quest_turn_in":
-            elder = self._get_interactable("elder_rhea")
-            if elder and isinstance(elder, NPC):
-                elder.set_dialogue("quest_epilogue")
-            self.current_prompt = "Return to the cloaked figure when you are ready."
-            return
-
-        if event_name == "flower_found":
-            sally = self._get_interactable("npc_sally")
-            if sally and isinstance(sally, NPC):
-                sally.set_dialogue("sally_thanks")
-            self.current_prompt = None
+        handler = self._EVENT_HANDLERS.get(event_name)
+        if handler is not None:
+            getattr(self, handler)(payload)
             return
 
-        if event_name == "sally_complete":
-            sally = self._get_interactable("npc_sally")
-            if sally and isinstance(sally, NPC):
-                sally.set_dialogue("sally_repeat")
-            self.current_prompt = "You obtained a Heart Shard!"
-            self.quest_manager.handle_event(
-                "quest_item_collected",
-                {"object_id": "quest_totem_b"},
-            )
-            return
+        triggered = self.quest_manager.handle_event(event_name, payload)
+        for action in triggered:
+            if action == "quest_completed":
+                self._on_quest_completed()
 
-        if event_name == "show_ending":
-            npc = self._get_interactable("npc_mia")
-            if npc and isinstance(npc, NPC):
-                npc.set_dialogue("mia_epilogue")
-            self.end_screen_active = True
-            self.active_dialogue = None
-            self.current_prompt = None
-            self.focus_interactable = None
-            return
+    def _handle_travel_to_forest(self, payload: dict) -> None:
+        self.request_map_change(MAP_OUTSIDE_FOREST, (900, 1100))
 
-        if event_name == "home_intro_end":
-            self.current_prompt = "Someone's knocking. Maybe I should check the door."
-            return
+    def _handle_quest_begin(self, payload: dict) -> None:
+        self.current_prompt = "Collect the three Heart Shards the cloaked figure described."
+        self.quest_tracker_visible = True
 
-        if event_name == "fisher_story_stage1":
-            fisher = self._get_interactable("npc_fisher")
-            if fisher and isinstance(fisher, NPC):
-                fisher.set_dialogue("fisher_story_stage2")
-            self.current_prompt = "Stay a while with the old fisher."
-            return
+    def _handle_quest_turn_in(self, payload: dict) -> None:
+        elder = self._get_interactable("elder_rhea")
+        if elder and isinstance(elder, NPC):
+            elder.set_dialogue("quest_epilogue")
+        self.current_prompt = "Return to the cloaked figure when you are ready."
 
-        if event_name == "fisher_story_stage2_done":
-            fisher = self._get_interactable("npc_fisher")
-            if fisher and isinstance(fisher, NPC):
-                fisher.set_dialogue("fisher_story_stage3")
-            self.current_prompt = "Listen to the fisher's memories."
-            return
+    def _handle_flower_found(self, payload: dict) -> None:
+        sally = self._get_interactable("npc_sally")
+        if sally and isinstance(sally, NPC):
+            sally.set_dialogue("sally_thanks")
+        self.current_prompt = None
 
-        if event_name == "fisher_story_reward":
-            fisher = self._get_interactable("npc_fisher")
-            if fisher and isinstance(fisher, NPC):
-                fisher.set_dialogue("fisher_repeat")
-            self.current_prompt = "You obtained a Heart Shard!"
-            triggered = self.quest_manager.handle_event(
-                "quest_item_collected",
-                {"object_id": "fisher_heart"},
-            )
-            for action in triggered:
-                if action == "quest_completed":
-                    self._on_quest_completed()
-            return
+    def _handle_sally_complete(self, payload: dict) -> None:
+        sally = self._get_interactable("npc_sally")
+        if sally and isinstance(sally, NPC):
+            sally.set_dialogue("sally_repeat")
+        self.current_prompt = "You obtained a Heart Shard!"
+        self.quest_manager.handle_event(
+            "quest_item_collected",
+            {"object_id": "quest_totem_b"},
+        )
 
-        if event_name == "mia_begin_transformation":
-            self._on_all_shards_collected()
-            return
+    def _handle_show_ending(self, payload: dict) -> None:
+        npc = self._get_interactable("npc_mia")
+        if npc and isinstance(npc, NPC):
+            npc.set_dialogue("mia_epilogue")
+        self.end_screen_active = True
+        self._build_end_screen()
+        self.active_dialogue = None
+        self.current_prompt = None
+        self.focus_interactable = None
 
-        triggered = self.quest_manager.handle_event(event_name, payload)
+    def _handle_home_intro_end(self, payload: dict) -> None:
+        self.current_prompt = "Someone's knocking. Maybe I should check the door."
+
+    def _handle_fisher_story_stage1(self, payload: dict) -> None:
+        fisher = self._get_interactable("npc_fisher")
+        if fisher and isinstance(fisher, NPC):
+            fisher.set_dialogue("fisher_story_stage2")
+        self.current_prompt = "Stay a while with the old fisher."
+
+    def _handle_fisher_story_stage2_done(self, payload: dict) -> None:
+        fisher = self._get_interactable("npc_fisher")
+        if fisher and isinstance(fisher, NPC):
+            fisher.set_dialogue("fisher_story_stage3")
+        self.current_prompt = "Listen to the fisher's memories."
+
+    def _handle_fisher_story_reward(self, payload: dict) -> None:
+        fisher = self._get_interactable("npc_fisher")
+        if fisher and isinstance(fisher, NPC):
+            fisher.set_dialogue("fisher_repeat")
+        self.current_prompt = "You obtained a Heart Shard!"
+        triggered = self.quest_manager.handle_event(
+            "quest_item_collected",
+            {"object_id": "fisher_heart"},
+        )
         for action in triggered:
             if action == "quest_completed":
                 self._on_quest_completed()
 
+    def _handle_mia_begin_transformation(self, payload: dict) -> None:
+        self._on_all_shards_collected()
+
     def _on_quest_completed(self) -> None:
         self._set_mia_dialogue("mia_transformation_intro")
         self.current_prompt = "Return to the cloaked figure when you feel ready."
@@ -278,82 +416,87 @@ class PlayState(GameState):
             return
 
     def _update_focus_interactable(self) -> None:
-        if self.end_screen_active:
+        # Nothing on the old map can be used while the next one loads.
+        if self.end_screen_active or self._load_future is not None:
             self.focus_interactable = None
             self.current_prompt = None
             return
 
-        self.focus_interactable = None
-        for interactable in self.map_manager.current_interactables:
-            if interactable.can_interact(self.player.rect):
-                self.focus_interactable = interactable
-                break
-
-        self.current_prompt = "Press [E] to Interact" if self.focus_interactable else None
+        focus = self.map_manager.interactable_near(self.player.rect)
+        prompt = INTERACT_PROMPT if focus else None
+        if focus is self.focus_interactable and self._current_prompt is prompt:
+            return
+        self.focus_interactable = focus
+        self.current_prompt = prompt
 
-    def _update_camera(self) -> None:
+    def _on_resize(self) -> None:
         self.view_width, self.view_height = self.game.view_size
-        map_rect = self.map_manager.map_rect
+        if self._end_blits is not None:
+            self._build_end_screen()
+        self._refresh_camera_bounds()
+        self._update_camera()
 
-        target_x = self.player.rect.centerx - self.view_width // 2
-        target_y = self.player.rect.centery - self.view_height // 2
+    def _refresh_camera_bounds(self) -> None:
+        """Recompute the camera clamp limits; needed after a map change or resize."""
+        map_rect = self.map_manager.map_rect
+        self._camera_max_x = max(0, map_rect.width - self.view_width)
+        self._camera_max_y = max(0, map_rect.height - self.view_height)
 
-        max_x = max(0, map_rect.width - self.view_width)
-        max_y = max(0, map_rect.height - self.view_height)
+    def _update_camera(self) -> None:
+        player_rect = self.player.rect
+        target_x = player_rect.centerx - self.view_width // 2
+        target_y = player_rect.centery - self.view_height // 2
 
-        self.camera.x = max(0, min(target_x, max_x))
-        self.camera.y = max(0, min(target_y, max_y))
+        self.camera.x = max(0, min(target_x, self._camera_max_x))
+        self.camera.y = max(0, min(target_y, self._camera_max_y))
 
-    def _draw_quest_tracker(self, surface: pygame.Surface) -> None:
+    def _queue_quest_tracker(self, blits: list[tuple[pygame.Surface, tuple[int, int]]]) -> None:
         if not self.quest_tracker_visible:
             return
 
         state = self.quest_manager.quests[QUEST_FIND_ARTIFACTS]
-        quest_status = (
-            f"Quest: {state.description} "
-            f"({len(state.items_collected)}/{state.items_required})"
-        )
-
-        color = (255, 255, 0) if state.completed else (255, 255, 255)
-        text_surface = self.quest_font.render(quest_status, True, color)
-        surface.blit(text_surface, (10, 10))
-
-    def _draw_end_screen(self, surface: pygame.Surface) -> None:
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        overlay.fill((0, 0, 0, 200))
-        surface.blit(overlay, (0, 0))
-
-        message_lines = [
-            "The Heart Gem shines brightest",
-            "when it's shared.",
-        ]
-        title_y = surface.get_height() // 2 - 40
-        for idx, line in enumerate(message_lines):
-            rendered = self.end_title_font.render(line, True, (255, 255, 255))
-            rect = rendered.get_rect(center=(surface.get_width() // 2, title_y + idx * 40))
-            surface.blit(rendered, rect)
+        key = (state.description, state.collected_count, state.items_required, state.completed)
+        if key != self._quest_tracker_key:
+            color = (255, 255, 0) if state.completed else (255, 255, 255)
+            self._quest_tracker_surface = self.quest_font.render(state.status_text(), True, color)
+            self._quest_tracker_key = key
+        blits.append((self._quest_tracker_surface, (10, 10)))
+
+    def _build_end_screen(self) -> None:
+        """Build the end-screen overlay and lay out its text for the current view."""
+        width, height = self.game.view_size
+        # Opaque surface with a surface-wide alpha: SDL blends that with a
+        # single factor instead of reading alpha per pixel.
+        self._end_overlay = pygame.Surface((width, height)).convert()
+        self._end_overlay.fill((0, 0, 0))
+        self._end_overlay.set_alpha(200)
+        blits: list[tuple[pygame.Surface, pygame.Rect | tuple[int, int]]] = [(self._end_overlay, (0, 0))]
+
+        title_y = height // 2 - 40
+        for idx, rendered in enumerate(self._end_title_surfaces):
+            blits.append((rendered, rendered.get_rect(center=(width // 2, title_y + idx * 40))))
 
         y = title_y + 110
-        lines = [
-            "You completed the Quest for the Heart Gem!",
-            "A new adventure begins — together.",
-            "",
-            "The Heart Gem shines brightest when it’s shared.",
-            "",
-            "Press Enter to return to the main menu.",
-        ]
-        for line in lines:
-            rendered = self.end_message_font.render(line, True, (220, 220, 220))
-            rect = rendered.get_rect(center=(surface.get_width() // 2, y))
-            surface.blit(rendered, rect)
+        for rendered in self._end_message_surfaces:
+            blits.append((rendered, rendered.get_rect(center=(width // 2, y))))
             y += rendered.get_height() + 6
+        self._end_blits = blits
+
+    def _draw_end_screen(self, surface: pygame.Surface) -> None:
+        if self._end_blits is None:
+            self._build_end_screen()
+        surface.blits(self._end_blits, doreturn=False)
 
     def _draw_flash(self, surface: pygame.Surface) -> None:
         if self.flash_timer <= 0:
             return
         alpha = int(255 * (self.flash_timer / self.flash_duration))
-        overlay = pygame.Surface(surface.get_size(), pygame.SRCALPHA)
-        overlay.fill((255, 255, 255, alpha))
+        overlay = self._flash_overlay
+        if overlay is None or overlay.get_size() != surface.get_size():
+            overlay = pygame.Surface(surface.get_size()).convert()
+            overlay.fill((255, 255, 255))
+            self._flash_overlay = overlay
+        overlay.set_alpha(alpha)
         surface.blit(overlay, (0, 0))
 
     def _flash_screen(self) -> None:
@@ -374,7 +517,7 @@ class PlayState(GameState):
             if isinstance(interactable, NPC) and interactable.object_id == "npc_mia":
                 mia_rect = interactable.rect.copy()
                 interactable.enabled = False
-                interactable.rect.topleft = (0, 0)
+                interactable.rect = pygame.Rect((0, 0), mia_rect.size)
                 break
 
         if mia_rect is None:
@@ -396,6 +539,9 @@ class PlayState(GameState):
             current_map.colliders.append(mia_rect.copy())
             self.aaron_spawned = True
 
+        current_map.rebuild_collider_grid()
+        current_map.rebuild_interactable_index()
+
         return mia_rect
 
     def _set_mia_dialogue(self, dialogue_id: str) -> None:
@@ -413,524 +559,438 @@ class PlayState(GameState):
                     interactable.enabled = True
 
     def _register_dialogues(self) -> None:
-        dm = self.dialogue_manager
-
-        dm.register(
-            "home_intro",
-            [
-                DialogueNode(
-                    "root",
-                    "Ah what a beautiful morning to start the day.",
-                    next_id="line2",
-                ),
-                DialogueNode(
-                    "line2",
-                    "I wonder who's that knocking at the door.",
-                    next_id="line3",
-                ),
-                DialogueNode(
-                    "line3",
-                    "I better check who it is, it might be important.",
-                    next_id=None,
-                    exit_event="home_intro_end",
-                ),
-            ],
-        )
-
-        dm.register(
-            "mia_intro",
-            [
-                DialogueNode(
-                    "root",
-                    "Ah, good morning, fair maiden! Have you heard of the Heart Gem?",
-                    next_id="line2",
-                ),
-                DialogueNode(
-                    "line2",
-                    "They say it only appears for someone whose heart beats true.",
-                    next_id="line3",
-                ),
-                DialogueNode(
-                    "line3",
-                    "If you find its three shards, the full gem -- and your destiny -- will reveal itself.",
-                    next_id="line4",
-                ),
-                DialogueNode(
-                    "line4",
-                    "Start by looking in the caves behind your house.",
-                    next_id="line5",
-                ),
-                DialogueNode(
-                    "line5",
-                    "Second, give a helping hand to someone in need. Check the Fortified Forest in the east.",
-                    next_id="line6",
-                ),
-                DialogueNode(
-                    "line6",
-                    "Lastly, talk to the Old Fisher by the beach.",
-                    next_id=None,
-                    exit_event="quest_begin",
-                ),
-            ],
-        )
-
-        dm.register(
-            "mia_confession",
-            [
-                DialogueNode(
-                    "root",
-                    "You found them all. The Heart Gem waits.",
-                    next_id="confession_2",
-                ),
-                DialogueNode(
-                    "confession_2",
-                    "But... there's one last thing it needs.",
-                    next_id="confession_3",
-                ),
-                DialogueNode(
-                    "confession_3",
-                    "It must know who your heart truly beats for.",
-                    next_id="confession_4",
-                ),
-                DialogueNode(
-                    "confession_4",
-                    "(Soft music begins to play...)",
-                    next_id="confession_5",
-                ),
-                DialogueNode(
-                    "confession_5",
-                    "You've gathered every shard...",
-                    next_id="confession_6",
-                ),
-                DialogueNode(
-                    "confession_6",
-                    "You've proven your heart's warmth, your courage, your care...",
-                    next_id="confession_7",
-                ),
-                DialogueNode(
-                    "confession_7",
-                    "So now there's only one question left.",
-                    next_id="confession_8",
-                ),
-                DialogueNode(
-                    "confession_8",
-                    "Dayana...",
-                    next_id="proposal",
-                ),
-                DialogueNode(
-                    "proposal",
-                    "Will you be my girlfriend?",
-                    choices=[
-                        DialogueChoice("[ Yes ]", next_id="accept"),
-                        DialogueChoice("[ Of course 💞 ]", next_id="accept"),
-                    ],
-                ),
-                DialogueNode(
-                    "accept",
-                    "You completed the Quest for the Heart Gem!",
-                    next_id="accept_2",
-                ),
-                DialogueNode(
-                    "accept_2",
-                    "A new adventure begins -- together.",
-                    next_id="accept_3",
-                ),
-                DialogueNode(
-                    "accept_3",
-                    "(Soft pixel music swells as the scene fades.)",
-                    next_id="ending",
-                ),
-                DialogueNode(
-                    "ending",
-                    "The Heart Gem shines brightest when it's shared.",
-                    next_id=None,
-                    exit_event="show_ending",
-                ),
-            ],
-        )
-
-        dm.register(
-            "mia_epilogue",
-            [
-                DialogueNode(
-                    "root",
-                    "The Heart Gem shines brightest when it's shared.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "mia_transformation_intro",
-            [
-                DialogueNode(
-                    "root",
-                    "You found them all. The Heart Gem waits.",
-                    next_id="line2",
-                ),
-                DialogueNode(
-                    "line2",
-                    "But... there's one last thing it needs.",
-                    next_id="line3",
-                ),
-                DialogueNode(
-                    "line3",
-                    "It must know who your heart truly beats for.",
-                    next_id=None,
-                    exit_event="mia_begin_transformation",
-                ),
-            ],
-        )
-
-        dm.register(
-            "aaron_proposal",
-            [
-                DialogueNode(
-                    "root",
-                    "You’ve gathered every shard…",
-                    next_id="line2",
-                ),
-                DialogueNode(
-                    "line2",
-                    "You’ve proven your heart’s warmth, your courage, your care…",
-                    next_id="line3",
-                ),
-                DialogueNode(
-                    "line3",
-                    "So now there’s only one question left.",
-                    next_id="line4",
-                ),
-                DialogueNode(
-                    "line4",
-                    "Dayana...",
-                    next_id="question",
-                ),
-                DialogueNode(
-                    "question",
-                    "Will you be my girlfriend?",
-                    choices=[
-                        DialogueChoice("Yes", next_id="accept"),
-                        DialogueChoice("Of course", next_id="accept"),
-                    ],
-                ),
-                DialogueNode(
-                    "accept",
-                    "",
-                    next_id=None,
-                    exit_event="show_ending",
-                ),
-            ],
-        )
-
-        dm.register(
-            "fisher_intro",
-            [
-                DialogueNode(
-                    "root",
-                    "This lake has been still for years. No one casts a line anymore.",
-                    next_id="line2",
-                ),
-                DialogueNode(
-                    "line2",
-                    "It’s been a while since I’ve spoken to someone.",
-                    next_id="line3",
-                ),
-                DialogueNode(
-                    "line3",
-                    "Do you think you can entertain this old man for a little while?",
-                    choices=[
-                        DialogueChoice("[ Yes ]", next_id="yes_start"),
-                        DialogueChoice("[ Maybe Later ]", next_id="later"),
-                    ],
-                ),
-                DialogueNode(
-                    "yes_start",
-                    "Heh, you know… I used to catch fish bigger than your whole head.",
-                    next_id="yes_2",
-                ),
-                DialogueNode(
-                    "yes_2",
-                    "These days? The only thing biting is mosquitoes.",
-                    next_id="yes_3",
-                ),
-                DialogueNode(
-                    "yes_3",
-                    "Still, having someone around breaks up the silence.",
-                    next_id="yes_4",
-                ),
-                DialogueNode(
-                    "yes_4",
-                    "If I talk to the lake any more it might start talking back.",
-                    next_id="yes_5",
-                ),
-                DialogueNode(
-                    "yes_5",
-                    "Stick around a moment, would you? I promise I won’t make you bait the hook.",
-                    next_id=None,
-                    exit_event="fisher_story_stage1",
-                ),
-                DialogueNode(
-                    "later",
-                    "Maybe another time then. The lake and I will be here.",
-                    next_id=None,
-                ),
-            ],
-        )
-
-        dm.register(
-            "fisher_story_stage2",
-            [
-                DialogueNode(
-                    "root",
-                    "Ahh… it really is nice just having company again.",
-                    next_id="line2",
-                ),
-                DialogueNode(
-                    "line2",
-                    "Most folks pass by without a word. Can’t blame ’em, life moves fast.",
-                    next_id="line3",
-                ),
-                DialogueNode(
-                    "line3",
-                    "But this—just talking, sharing a quiet moment by the water… this means more to me than you know.",
-                    next_id=None,
-                    exit_event="fisher_story_stage2_done",
-                ),
-            ],
-        )
-
-        dm.register(
-            "fisher_story_stage3",
-            [
-                DialogueNode(
-                    "root",
-                    "I used to sit here with someone very dear to me…",
-                    next_id="line2",
-                ),
-                DialogueNode(
-                    "line2",
-                    "and when they were gone, I thought the lake would feel empty forever.",
-                    next_id="line3",
-                ),
-                DialogueNode(
-                    "line3",
-                    "But right now… with you here… it feels like a piece of those days came back to me.",
-                    next_id="line4",
-                ),
-                DialogueNode(
-                    "line4",
-                    "Thank you, truly.",
-                    next_id="line5",
-                ),
-                DialogueNode(
-                    "line5",
-                    "Here, take this — something the water left behind.",
-                    next_id="reward",
-                ),
-                DialogueNode(
-                    "reward",
-                    "**You got a Heart Shard!**",
-                    next_id=None,
-                    exit_event="fisher_story_reward",
-                ),
-            ],
-        )
-
-        dm.register(
-            "fisher_repeat",
-            [
-                DialogueNode(
-                    "root",
-                    "Stay as long as you like. The lake and I appreciate the company.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "sally_missing",
-            [
-                DialogueNode(
-                    "root",
-                    "I can't find my flower... It was so pretty and pink.",
-                    next_id="clue",
-                ),
-                DialogueNode(
-                    "clue",
-                    "It's somewhere in this tall grass. That's where I last had it.",
-                    next_id=None,
-                ),
-            ],
-        )
-
-        dm.register(
-            "sally_flower_item",
-            [
-                DialogueNode(
-                    "root",
-                    "You gently pick up a delicate pink flower nestled in the grass.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "sally_thanks",
-            [
-                DialogueNode(
-                    "root",
-                    "You found it! Thank you, kind one.",
-                    next_id="shimmer",
-                ),
-                DialogueNode(
-                    "shimmer",
-                    "Something shines near your feet...",
-                    next_id="reward",
-                ),
-                DialogueNode(
-                    "reward",
-                    "**You got a Heart Shard!**",
-                    next_id=None,
-                    exit_event="sally_complete",
-                ),
-            ],
-        )
-
-        dm.register(
-            "sally_repeat",
-            [
-                DialogueNode(
-                    "root",
-                    "Thank you so much again!!",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "forest_sign",
-            [
-                DialogueNode(
-                    "root",
-                    "Fortified Forest ahead.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "cave_sign",
-            [
-                DialogueNode(
-                    "root",
-                    "Cavernous Caves ahead.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "cave_warning",
-            [
-                DialogueNode(
-                    "root",
-                    "Be careful. Many travelers have gotten lost.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "cave_chest",
-            [
-                DialogueNode(
-                    "root",
-                    "**You got a Heart Shard!**",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "quest_item_b",
-            [
-                DialogueNode(
-                    "root",
-                    "A Heart Shard gifted for lending a helping hand.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "quest_item_c",
-            [
-                DialogueNode(
-                    "root",
-                    "The final Heart Shard pulses warmly in your hands.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "village_sign",
-            [
-                DialogueNode(
-                    "root",
-                    "Village of Lumeris - A place of harmony between trainers and spirits.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "bookshelf",
-            [
-                DialogueNode(
-                    "root",
-                    "The bookshelf is stuffed with battle tactics manuals and berry recipes.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "forest_shrine",
-            [
-                DialogueNode(
-                    "root",
-                    "The shrine hums with the promise of a completed Heart Gem.",
-                    next_id=None,
-                )
-            ],
-        )
-
-        dm.register(
-            "quest_complete",
-            [
-                DialogueNode(
-                    "root",
-                    "Welcome, seeker of the Heart Gem. Your devotion brought its light back.",
-                    next_id="continue",
-                ),
-                DialogueNode(
-                    "continue",
-                    "I will keep its glow safe. Thank you for believing in love's power.",
-                    next_id=None,
-                    exit_event="quest_turn_in",
-                ),
-            ],
-        )
-
-        dm.register(
-            "quest_epilogue",
-            [
-                DialogueNode(
-                    "root",
-                    "May your journey continue with the blessings of the spirits.",
-                    next_id=None,
-                )
-            ],
-        )
-
+        self.dialogue_manager.register_bulk(_build_dialogues())
+        self._dialogue_factories: dict[str, Callable[[str], DialogueSession]] = {
+            dialogue_id: self.dialogue_manager.factory(dialogue_id)
+            for dialogue_id in self.dialogue_manager.dialogues
+        }
+
+        # Dialogue text never changes, so rasterize it all up front.
+        for graph in self.dialogue_manager.dialogues.values():
+            self.dialogue_box.prerender(graph.nodes, self.view_width)
+
+
+@cache
+def _build_dialogues() -> dict[str, list[DialogueNode]]:
+    """Every dialogue in the game, built once and shared between PlayStates."""
+    return {
+        "home_intro": [
+            DialogueNode(
+                "root",
+                "Ah what a beautiful morning to start the day.",
+                next_id="line2",
+            ),
+            DialogueNode(
+                "line2",
+                "I wonder who's that knocking at the door.",
+                next_id="line3",
+            ),
+            DialogueNode(
+                "line3",
+                "I better check who it is, it might be important.",
+                next_id=None,
+                exit_event="home_intro_end",
+            ),
+        ],
+        "mia_intro": [
+            DialogueNode(
+                "root",
+                "Ah, good morning, fair maiden! Have you heard of the Heart Gem?",
+                next_id="line2",
+            ),
+            DialogueNode(
+                "line2",
+                "They say it only appears for someone whose heart beats true.",
+                next_id="line3",
+            ),
+            DialogueNode(
+                "line3",
+                "If you find its three shards, the full gem -- and your destiny -- will reveal itself.",
+                next_id="line4",
+            ),
+            DialogueNode(
+                "line4",
+                "Start by looking in the caves behind your house.",
+                next_id="line5",
+            ),
+            DialogueNode(
+                "line5",
+                "Second, give a helping hand to someone in need. Check the Fortified Forest in the east.",
+                next_id="line6",
+            ),
+            DialogueNode(
+                "line6",
+                "Lastly, talk to the Old Fisher by the beach.",
+                next_id=None,
+                exit_event="quest_begin",
+            ),
+        ],
+        "mia_confession": [
+            DialogueNode(
+                "root",
+                "You found them all. The Heart Gem waits.",
+                next_id="confession_2",
+            ),
+            DialogueNode(
+                "confession_2",
+                "But... there's one last thing it needs.",
+                next_id="confession_3",
+            ),
+            DialogueNode(
+                "confession_3",
+                "It must know who your heart truly beats for.",
+                next_id="confession_4",
+            ),
+            DialogueNode(
+                "confession_4",
+                "(Soft music begins to play...)",
+                next_id="confession_5",
+            ),
+            DialogueNode(
+                "confession_5",
+                "You've gathered every shard...",
+                next_id="confession_6",
+            ),
+            DialogueNode(
+                "confession_6",
+                "You've proven your heart's warmth, your courage, your care...",
+                next_id="confession_7",
+            ),
+            DialogueNode(
+                "confession_7",
+                "So now there's only one question left.",
+                next_id="confession_8",
+            ),
+            DialogueNode(
+                "confession_8",
+                "Dayana...",
+                next_id="proposal",
+            ),
+            DialogueNode(
+                "proposal",
+                "Will you be my girlfriend?",
+                choices=[
+                    DialogueChoice("[ Yes ]", next_id="accept"),
+                    DialogueChoice("[ Of course 💞 ]", next_id="accept"),
+                ],
+            ),
+            DialogueNode(
+                "accept",
+                "You completed the Quest for the Heart Gem!",
+                next_id="accept_2",
+            ),
+            DialogueNode(
+                "accept_2",
+                "A new adventure begins -- together.",
+                next_id="accept_3",
+            ),
+            DialogueNode(
+                "accept_3",
+                "(Soft pixel music swells as the scene fades.)",
+                next_id="ending",
+            ),
+            DialogueNode(
+                "ending",
+                "The Heart Gem shines brightest when it's shared.",
+                next_id=None,
+                exit_event="show_ending",
+            ),
+        ],
+        "mia_epilogue": [
+            DialogueNode(
+                "root",
+                "The Heart Gem shines brightest when it's shared.",
+                next_id=None,
+            )
+        ],
+        "mia_transformation_intro": [
+            DialogueNode(
+                "root",
+                "You found them all. The Heart Gem waits.",
+                next_id="line2",
+            ),
+            DialogueNode(
+                "line2",
+                "But... there's one last thing it needs.",
+                next_id="line3",
+            ),
+            DialogueNode(
+                "line3",
+                "It must know who your heart truly beats for.",
+                next_id=None,
+                exit_event="mia_begin_transformation",
+            ),
+        ],
+        "aaron_proposal": [
+            DialogueNode(
+                "root",
+                "You’ve gathered every shard…",
+                next_id="line2",
+            ),
+            DialogueNode(
+                "line2",
+                "You’ve proven your heart’s warmth, your courage, your care…",
+                next_id="line3",
+            ),
+            DialogueNode(
+                "line3",
+                "So now there’s only one question left.",
+                next_id="line4",
+            ),
+            DialogueNode(
+                "line4",
+                "Dayana...",
+                next_id="question",
+            ),
+            DialogueNode(
+                "question",
+                "Will you be my girlfriend?",
+                choices=[
+                    DialogueChoice("Yes", next_id="accept"),
+                    DialogueChoice("Of course", next_id="accept"),
+                ],
+            ),
+            DialogueNode(
+                "accept",
+                "",
+                next_id=None,
+                exit_event="show_ending",
+            ),
+        ],
+        "fisher_intro": [
+            DialogueNode(
+                "root",
+                "This lake has been still for years. No one casts a line anymore.",
+                next_id="line2",
+            ),
+            DialogueNode(
+                "line2",
+                "It’s been a while since I’ve spoken to someone.",
+                next_id="line3",
+            ),
+            DialogueNode(
+                "line3",
+                "Do you think you can entertain this old man for a little while?",
+                choices=[
+                    DialogueChoice("[ Yes ]", next_id="yes_start"),
+                    DialogueChoice("[ Maybe Later ]", next_id="later"),
+                ],
+            ),
+            DialogueNode(
+                "yes_start",
+                "Heh, you know… I used to catch fish bigger than your whole head.",
+                next_id="yes_2",
+            ),
+            DialogueNode(
+                "yes_2",
+                "These days? The only thing biting is mosquitoes.",
+                next_id="yes_3",
+            ),
+            DialogueNode(
+                "yes_3",
+                "Still, having someone around breaks up the silence.",
+                next_id="yes_4",
+            ),
+            DialogueNode(
+                "yes_4",
+                "If I talk to the lake any more it might start talking back.",
+                next_id="yes_5",
+            ),
+            DialogueNode(
+                "yes_5",
+                "Stick around a moment, would you? I promise I won’t make you bait the hook.",
+                next_id=None,
+                exit_event="fisher_story_stage1",
+            ),
+            DialogueNode(
+                "later",
+                "Maybe another time then. The lake and I will be here.",
+                next_id=None,
+            ),
+        ],
+        "fisher_story_stage2": [
+            DialogueNode(
+                "root",
+                "Ahh… it really is nice just having company again.",
+                next_id="line2",
+            ),
+            DialogueNode(
+                "line2",
+                "Most folks pass by without a word. Can’t blame ’em, life moves fast.",
+                next_id="line3",
+            ),
+            DialogueNode(
+                "line3",
+                "But this—just talking, sharing a quiet moment by the water… this means more to me than you know.",
+                next_id=None,
+                exit_event="fisher_story_stage2_done",
+            ),
+        ],
+        "fisher_story_stage3": [
+            DialogueNode(
+                "root",
+                "I used to sit here with someone very dear to me…",
+                next_id="line2",
+            ),
+            DialogueNode(
+                "line2",
+                "and when they were gone, I thought the lake would feel empty forever.",
+                next_id="line3",
+            ),
+            DialogueNode(
+                "line3",
+                "But right now… with you here… it feels like a piece of those days came back to me.",
+                next_id="line4",
+            ),
+            DialogueNode(
+                "line4",
+                "Thank you, truly.",
+                next_id="line5",
+            ),
+            DialogueNode(
+                "line5",
+                "Here, take this — something the water left behind.",
+                next_id="reward",
+            ),
+            DialogueNode(
+                "reward",
+                "**You got a Heart Shard!**",
+                next_id=None,
+                exit_event="fisher_story_reward",
+            ),
+        ],
+        "fisher_repeat": [
+            DialogueNode(
+                "root",
+                "Stay as long as you like. The lake and I appreciate the company.",
+                next_id=None,
+            )
+        ],
+        "sally_missing": [
+            DialogueNode(
+                "root",
+                "I can't find my flower... It was so pretty and pink.",
+                next_id="clue",
+            ),
+            DialogueNode(
+                "clue",
+                "It's somewhere in this tall grass. That's where I last had it.",
+                next_id=None,
+            ),
+        ],
+        "sally_flower_item": [
+            DialogueNode(
+                "root",
+                "You gently pick up a delicate pink flower nestled in the grass.",
+                next_id=None,
+            )
+        ],
+        "sally_thanks": [
+            DialogueNode(
+                "root",
+                "You found it! Thank you, kind one.",
+                next_id="shimmer",
+            ),
+            DialogueNode(
+                "shimmer",
+                "Something shines near your feet...",
+                next_id="reward",
+            ),
+            DialogueNode(
+                "reward",
+                "**You got a Heart Shard!**",
+                next_id=None,
+                exit_event="sally_complete",
+            ),
+        ],
+        "sally_repeat": [
+            DialogueNode(
+                "root",
+                "Thank you so much again!!",
+                next_id=None,
+            )
+        ],
+        "forest_sign": [
+            DialogueNode(
+                "root",
+                "Fortified Forest ahead.",
+                next_id=None,
+            )
+        ],
+        "cave_sign": [
+            DialogueNode(
+                "root",
+                "Cavernous Caves ahead.",
+                next_id=None,
+            )
+        ],
+        "cave_warning": [
+            DialogueNode(
+                "root",
+                "Be careful. Many travelers have gotten lost.",
+                next_id=None,
+            )
+        ],
+        "cave_chest": [
+            DialogueNode(
+                "root",
+                "**You got a Heart Shard!**",
+                next_id=None,
+            )
+        ],
+        "quest_item_b": [
+            DialogueNode(
+                "root",
+                "A Heart Shard gifted for lending a helping hand.",
+                next_id=None,
+            )
+        ],
+        "quest_item_c": [
+            DialogueNode(
+                "root",
+                "The final Heart Shard pulses warmly in your hands.",
+                next_id=None,
+            )
+        ],
+        "village_sign": [
+            DialogueNode(
+                "root",
+                "Village of Lumeris - A place of harmony between trainers and spirits.",
+                next_id=None,
+            )
+        ],
+        "bookshelf": [
+            DialogueNode(
+                "root",
+                "The bookshelf is stuffed with battle tactics manuals and berry recipes.",
+                next_id=None,
+            )
+        ],
+        "forest_shrine": [
+            DialogueNode(
+                "root",
+                "The shrine hums with the promise of a completed Heart Gem.",
+                next_id=None,
+            )
+        ],
+        "quest_complete": [
+            DialogueNode(
+                "root",
+                "Welcome, seeker of the Heart Gem. Your devotion brought its light back.",
+                next_id="continue",
+            ),
+            DialogueNode(
+                "continue",
+                "I will keep its glow safe. Thank you for believing in love's power.",
+                next_id=None,
+                exit_event="quest_turn_in",
+            ),
+        ],
+        "quest_epilogue": [
+            DialogueNode(
+                "root",
+                "May your journey continue with the blessings of the spirits.",
+                next_id=None,
+            )
+        ],
+    }
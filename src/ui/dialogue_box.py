@@ -1,8 +1,13 @@
 from __future__ import annotations
 
+from collections import OrderedDict
+from typing import Iterable
+
 import pygame
 
-from core.dialogue import DialogueSession
+from core.dialogue import DialogueChoice, DialogueNode, DialogueSession
+from core.fonts import get_font
+from core.render import blit_many
 from core.settings import (
     DIALOGUE_BG_COLOR,
     DIALOGUE_FONT_NAME,
@@ -12,77 +17,227 @@ from core.settings import (
 )
 
 
+CHOICE_COLOR = (180, 180, 180)
+CHOICE_SELECTED_COLOR = (255, 255, 0)
+# Comfortably above the number of dialogue nodes in the game, so a
+# prerendered session never has to re-rasterize.
+TEXT_CACHE_SIZE = 128
+CHOICE_LAYOUT_CACHE_SIZE = 32
+
+WRAP_SAMPLE = "the quick brown fox jumps over the lazy dog"
+
+TextLayout = tuple[list[pygame.Surface], list[int]]
+ChoiceLayout = list[tuple[pygame.Surface, tuple[int, int]]]
+# A choice label rendered (unselected, selected).
+ChoiceVariants = tuple[pygame.Surface, pygame.Surface]
+
+
 class DialogueBox:
     """Renders dialogue text and choices."""
 
+    # Shared between boxes: fonts come from get_font and dialogue nodes are
+    # built once per process, so a layout stays valid across play states.
+    _text_cache: OrderedDict[tuple[int, str, int], TextLayout] = OrderedDict()
+    _choice_layout_cache: OrderedDict[tuple[int, int, int, int], ChoiceLayout] = OrderedDict()
+    # Keyed by label text; the game has a few dozen distinct labels at most.
+    _choice_cache: dict[str, ChoiceVariants] = {}
+    # Wrapped lines per (words, width); outlives the rendered text LRU.
+    _wrap_cache: dict[tuple[tuple[str, ...], int], list[str]] = {}
+
     def __init__(self) -> None:
-        self.font = pygame.font.Font(
-            pygame.font.match_font(DIALOGUE_FONT_NAME), DIALOGUE_FONT_SIZE
-        )
+        self.font = get_font(DIALOGUE_FONT_SIZE, DIALOGUE_FONT_NAME)
+        # Only seeds the wrap estimate; exact widths are always measured.
+        self.avg_char_width = max(1, self.font.size(WRAP_SAMPLE)[0] // len(WRAP_SAMPLE))
+        self.font_height = self.font.get_height()
         self.margin = DIALOGUE_PADDING
         self.speaker_surface: pygame.Surface | None = None
+        # Box geometry for the last target size; rebuilt only on resize.
+        self._target_size: tuple[int, int] | None = None
+        self._box_rect = pygame.Rect(0, 0, 0, 0)
+        self._text_area = pygame.Rect(0, 0, 0, 0)
+        self._background: pygame.Surface | None = None
+        # Background, text and choices flattened together for the node and
+        # selection below; recomposed only when one of them changes.
+        self._composed: pygame.Surface | None = None
+        self._composed_node: DialogueNode | None = None
+        self._composed_choice = -1
+
+    def text_width(self, view_width: int) -> int:
+        """Width of the wrapped text area for a target ``view_width`` wide."""
+        return view_width - self.margin * 4
+
+    def prerender(self, nodes: Iterable[DialogueNode], view_width: int) -> None:
+        """Render node text and choice labels once, ahead of drawing them."""
+        width = self.text_width(view_width)
+        for node in nodes:
+            self._text_layout(node, width)
+            for choice in node.choices:
+                self._choice_variants(choice)
+
+    def draw(self, target: pygame.Surface, session: DialogueSession) -> pygame.Rect:
+        """Draw the box for ``session`` onto ``target`` and return the area it covers."""
+        size = target.get_size()
+        if size != self._target_size:
+            self._layout_box(size)
 
-    def draw(self, target: pygame.Surface, session: DialogueSession) -> None:
-        width, height = target.get_size()
+        node = session.current_node
+        choice_index = session.choice_index
+        if node is not self._composed_node or choice_index != self._composed_choice:
+            self._compose(node, choice_index)
+        target.blit(self._composed, self._box_rect)
+        return self._box_rect
+
+    def _compose(self, node: DialogueNode, choice_index: int) -> None:
+        composed = self._composed = self._background.copy()
+        self._draw_text(composed, node, self._text_area)
+        if node.choices:
+            self._draw_choices(composed, node.choices, choice_index, self._text_area)
+        self._composed_node = node
+        self._composed_choice = choice_index
+
+    def _layout_box(self, size: tuple[int, int]) -> None:
+        width, height = size
         box_height = height // 3
-        surface_rect = pygame.Rect(
+        self._box_rect.update(
             self.margin,
             height - box_height,
             width - self.margin * 2,
             box_height - self.margin,
         )
-
-        pygame.draw.rect(target, DIALOGUE_BG_COLOR, surface_rect, border_radius=8)
-        pygame.draw.rect(target, (80, 80, 80), surface_rect, width=2, border_radius=8)
-
-        text_area = surface_rect.inflate(-self.margin * 2, -self.margin * 2)
-        node = session.current_node
-
-        self._render_text(target, node.text, text_area, DIALOGUE_TEXT_COLOR)
-
-        if node.choices:
-            self._render_choices(target, node.choices, session.choice_index, text_area)
-
-    def _render_text(self, surface: pygame.Surface, text: str, area: pygame.Rect, color: tuple[int, int, int]) -> None:
-        words = text.split(" ")
+        # Text is drawn onto the composed box, so its area is box-relative.
+        self._text_area.update(0, 0, self._box_rect.width, self._box_rect.height)
+        self._text_area.inflate_ip(-self.margin * 2, -self.margin * 2)
+        self._background = self._build_background(self._box_rect.size)
+        self._composed_node = None
+        self._target_size = size
+
+    def _build_background(self, size: tuple[int, int]) -> pygame.Surface:
+        """Rasterize the rounded box once; the corners are left transparent.
+
+        Per-pixel alpha keeps text blended onto it identical to text blended
+        straight onto the render surface, which shares this format.
+        """
+        background = pygame.Surface(size).convert_alpha()
+        background.fill((0, 0, 0, 0))
+        box = background.get_rect()
+        pygame.draw.rect(background, DIALOGUE_BG_COLOR, box, border_radius=8)
+        pygame.draw.rect(background, (80, 80, 80), box, width=2, border_radius=8)
+        return background
+
+    def _text_layout(self, node: DialogueNode, width: int) -> TextLayout:
+        """Rendered lines of ``node`` wrapped to ``width``, with their y offsets."""
+        key = (id(node), node.text, width)
+        cache = self._text_cache
+        layout = cache.get(key)
+        if layout is not None:
+            cache.move_to_end(key)
+            return layout
+
+        wrap_key = (node.words, width)
+        wrapped = self._wrap_cache.get(wrap_key)
+        if wrapped is None:
+            wrapped = self._wrap_cache[wrap_key] = self._wrap(node.words, width)
+        lines = [self.font.render(line, True, DIALOGUE_TEXT_COLOR) for line in wrapped[:4]]
+        offsets: list[int] = []
+        y = 0
+        for line in lines:
+            offsets.append(y)
+            y += line.get_height() + 4
+
+        layout = (lines, offsets)
+        cache[key] = layout
+        if len(cache) > TEXT_CACHE_SIZE:
+            cache.popitem(last=False)
+        return layout
+
+    def _choice_variants(self, choice: DialogueChoice) -> ChoiceVariants:
+        text = choice.text
+        variants = self._choice_cache.get(text)
+        if variants is None:
+            variants = self._choice_cache[text] = (
+                self.font.render("  " + text, True, CHOICE_COLOR),
+                self.font.render("> " + text, True, CHOICE_SELECTED_COLOR),
+            )
+        return variants
+
+    def _wrap(self, words: tuple[str, ...], width: int) -> list[str]:
+        """Greedily break ``words`` into lines at most ``width`` wide.
+
+        Rather than measuring every growing prefix, guess the line from the
+        average glyph width and then add or drop words until the measured
+        width fits, so each line costs a couple of font.size calls.
+        """
+        if not words:
+            return []
+        size = self.font.size
+        count = len(words)
+        budget = width // self.avg_char_width
         lines: list[str] = []
-        current_line = ""
-
-        for word in words:
-            test_line = f"{current_line} {word}".strip()
-            if self.font.size(test_line)[0] <= area.width:
-                current_line = test_line
+        start = 0
+
+        while start < count:
+            end = start + 1
+            chars = len(words[start])
+            while end < count and chars + 1 + len(words[end]) <= budget:
+                chars += 1 + len(words[end])
+                end += 1
+
+            if size(" ".join(words[start:end]))[0] <= width:
+                while end < count and size(" ".join(words[start:end + 1]))[0] <= width:
+                    end += 1
             else:
-                lines.append(current_line)
-                current_line = word
-        if current_line:
-            lines.append(current_line)
-
-        y = area.top
-        for line in lines[:4]:
-            rendered = self.font.render(line, True, color)
-            surface.blit(rendered, (area.left, y))
-            y += rendered.get_height() + 4
-
-    def _render_choices(self, surface: pygame.Surface, choices, selected_index: int, area: pygame.Rect) -> None:
-        line_height = self.font.get_height()
+                while end > start + 1:
+                    end -= 1
+                    if size(" ".join(words[start:end]))[0] <= width:
+                        break
+                else:
+                    if start == 0:
+                        # An over-long first word has always been pushed
+                        # below an empty line; keep that layout.
+                        lines.append("")
+
+            lines.append(" ".join(words[start:end]))
+            start = end
+        return lines
+
+    def _draw_text(self, surface: pygame.Surface, node: DialogueNode, area: pygame.Rect) -> None:
+        lines, offsets = self._text_layout(node, area.width)
+        left = area.left
+        top = area.top
+        blit_many(surface, [(line, (left, top + offset)) for line, offset in zip(lines, offsets)])
+
+    def _draw_choices(self, surface: pygame.Surface, choices, selected_index: int, area: pygame.Rect) -> None:
+        key = (id(choices), selected_index, area.left, area.bottom)
+        cache = self._choice_layout_cache
+        layout = cache.get(key)
+        if layout is None:
+            layout = self._layout_choices(choices, selected_index, area)
+            cache[key] = layout
+            if len(cache) > CHOICE_LAYOUT_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+
+        blit_many(surface, layout)
+
+    def _layout_choices(self, choices, selected_index: int, area: pygame.Rect) -> ChoiceLayout:
+        line_height = self.font_height
         spacing = 18
+        layout: ChoiceLayout = []
 
         if len(choices) <= 2:
             y = area.bottom - line_height - 6
             x = area.left
             for idx, choice in enumerate(choices):
-                prefix = "> " if idx == selected_index else "  "
-                color = (255, 255, 0) if idx == selected_index else (180, 180, 180)
-                rendered = self.font.render(prefix + choice.text, True, color)
-                surface.blit(rendered, (x, y))
+                variants = self._choice_variants(choice)
+                rendered = variants[idx == selected_index]
+                layout.append((rendered, (x, y)))
                 x += rendered.get_width() + spacing
         else:
             y = area.bottom - (len(choices) * (line_height + 6))
             for idx, choice in enumerate(choices):
-                prefix = "> " if idx == selected_index else "  "
-                color = (255, 255, 0) if idx == selected_index else (180, 180, 180)
-                rendered = self.font.render(prefix + choice.text, True, color)
-                surface.blit(rendered, (area.left, y))
+                variants = self._choice_variants(choice)
+                rendered = variants[idx == selected_index]
+                layout.append((rendered, (area.left, y)))
                 y += rendered.get_height() + 6
-
+        return layout
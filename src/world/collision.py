@@ -0,0 +1,86 @@
+from __future__ import annotations
+
+from typing import Iterable
+
+import pygame
+
+
+def merge_row_runs(rects: Iterable[pygame.Rect]) -> list[pygame.Rect]:
+    """Merge rects sharing a top edge and height that touch or overlap in x.
+
+    The merged rects cover exactly the same area, so collision results are
+    unchanged while a wall of N tiles becomes a single rect.
+    """
+    bands: dict[tuple[int, int], list[pygame.Rect]] = {}
+    for rect in rects:
+        bands.setdefault((rect.top, rect.height), []).append(rect)
+
+    merged: list[pygame.Rect] = []
+    for band in bands.values():
+        band.sort(key=lambda rect: rect.left)
+        current = band[0].copy()
+        for rect in band[1:]:
+            if rect.left <= current.right:
+                current.width = max(current.right, rect.right) - current.left
+            else:
+                merged.append(current)
+                current = rect.copy()
+        merged.append(current)
+    return merged
+
+
+def coalesce_tile_rects(
+    rects: Iterable[pygame.Rect],
+    tile_w: int,
+    tile_h: int,
+) -> list[pygame.Rect]:
+    """Cover single-tile rects with as few larger rects as a greedy pass finds.
+
+    Each run of solid tiles along a row is grown downwards while every tile
+    beneath it is solid, then emitted as one rect and masked out. Rects that
+    are not exactly one grid-aligned tile are merged with merge_row_runs.
+    The covered area never changes.
+    """
+    solid: set[tuple[int, int]] = set()
+    others: list[pygame.Rect] = []
+    for rect in rects:
+        if (
+            rect.width == tile_w
+            and rect.height == tile_h
+            and rect.x % tile_w == 0
+            and rect.y % tile_h == 0
+        ):
+            solid.add((rect.x // tile_w, rect.y // tile_h))
+        else:
+            others.append(rect)
+
+    merged: list[pygame.Rect] = []
+    for x0, y0 in sorted(solid, key=lambda cell: (cell[1], cell[0])):
+        if (x0, y0) not in solid:
+            continue
+        x1 = x0
+        while (x1 + 1, y0) in solid:
+            x1 += 1
+        y1 = y0
+        while all((x, y1 + 1) in solid for x in range(x0, x1 + 1)):
+            y1 += 1
+        for y in range(y0, y1 + 1):
+            for x in range(x0, x1 + 1):
+                solid.discard((x, y))
+        merged.append(
+            pygame.Rect(x0 * tile_w, y0 * tile_h, (x1 - x0 + 1) * tile_w, (y1 - y0 + 1) * tile_h)
+        )
+
+    if others:
+        merged.extend(merge_row_runs(others))
+    return merged
+
+
+def build_index_grid(rects: Iterable[pygame.Rect], cell: int) -> dict[tuple[int, int], list[int]]:
+    """Bucket positions in ``rects`` by every grid cell each rect overlaps."""
+    grid: dict[tuple[int, int], list[int]] = {}
+    for index, rect in enumerate(rects):
+        for cx in range(rect.left // cell, (rect.right - 1) // cell + 1):
+            for cy in range(rect.top // cell, (rect.bottom - 1) // cell + 1):
+                grid.setdefault((cx, cy), []).append(index)
+    return grid
@@ -0,0 +1,145 @@
+from __future__ import annotations
+
+import hashlib
+import os
+import pickle
+import tempfile
+from pathlib import Path
+from xml.etree import ElementTree
+
+import pygame
+
+from core.settings import MAP_CACHE_ENABLED
+
+
+CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "maps"
+# Bump when the stored layout changes so stale entries are ignored.
+CACHE_VERSION = 3
+
+
+class CachedMap:
+    """Rendered map pixels and merged colliders restored from the disk cache.
+
+    The pixels stay raw bytes so an entry can be read on any thread;
+    to_surface makes the display surface and belongs on the main thread.
+    """
+
+    __slots__ = ("size", "format", "pixels", "colliders")
+
+    def __init__(
+        self,
+        size: tuple[int, int],
+        pixel_format: str,
+        pixels: bytes,
+        colliders: list[pygame.Rect],
+    ) -> None:
+        self.size = size
+        self.format = pixel_format
+        self.pixels = pixels
+        self.colliders = colliders
+
+    def to_surface(self) -> pygame.Surface:
+        surface = pygame.image.fromstring(self.pixels, self.size, self.format)
+        if self.format == "RGB":
+            surface = surface.convert()
+        return surface
+
+
+def _source_files(tmx_path: Path) -> list[Path]:
+    """``tmx_path`` plus every external tileset and image it draws from."""
+    files = [tmx_path]
+    documents = [(tmx_path, ElementTree.parse(tmx_path).getroot())]
+    for tileset in documents[0][1].iter("tileset"):
+        source = tileset.get("source")
+        if source:
+            tsx_path = tmx_path.parent / source
+            files.append(tsx_path)
+            documents.append((tsx_path, ElementTree.parse(tsx_path).getroot()))
+    # Image paths are relative to the file that names them.
+    for path, root in documents:
+        for image in root.iter("image"):
+            source = image.get("source")
+            if source:
+                files.append(path.parent / source)
+    return files
+
+
+def _cache_file(
+    tmx_path: Path,
+    collision_layers: tuple[str, ...],
+    collider_inputs: tuple,
+) -> Path | None:
+    # Rendered pixels go stale when the map, a tileset or a tileset image
+    # changes, so all of their mtimes are part of the key.
+    try:
+        sources = tuple(
+            (str(path.resolve()), path.stat().st_mtime_ns) for path in _source_files(tmx_path)
+        )
+    except (OSError, ElementTree.ParseError):
+        return None
+    key = repr((CACHE_VERSION, sources, collision_layers, collider_inputs))
+    return CACHE_DIR / f"{hashlib.sha1(key.encode()).hexdigest()}.pickle"
+
+
+def load(
+    tmx_path: Path,
+    collision_layers: tuple[str, ...],
+    collider_inputs: tuple,
+) -> CachedMap | None:
+    """Return the cached render of ``tmx_path``, or None on a miss.
+
+    Entries are keyed by the mtimes of the map and every tileset file and
+    image it uses, so editing any of them invalidates the entry.
+    ``collider_inputs`` is whatever else the stored colliders were derived
+    from; its repr is part of the key. Any unreadable entry is a miss.
+    """
+    if not MAP_CACHE_ENABLED:
+        return None
+    cache_file = _cache_file(tmx_path, collision_layers, collider_inputs)
+    if cache_file is None or not cache_file.exists():
+        return None
+    try:
+        with cache_file.open("rb") as handle:
+            entry = pickle.load(handle)
+        (width, height), pixel_format, pixels = entry["size"], entry["format"], entry["pixels"]
+        # Checked here so to_surface cannot fail on a truncated entry later.
+        if pixel_format not in ("RGB", "RGBA") or len(pixels) != width * height * len(pixel_format):
+            return None
+        colliders = [pygame.Rect(rect) for rect in entry["colliders"]]
+    except (OSError, pickle.PickleError, EOFError, KeyError, TypeError, ValueError):
+        return None
+    return CachedMap((width, height), pixel_format, pixels, colliders)
+
+
+def store(
+    tmx_path: Path,
+    collision_layers: tuple[str, ...],
+    collider_inputs: tuple,
+    surface: pygame.Surface,
+    colliders: list[pygame.Rect],
+) -> None:
+    """Write ``surface`` and ``colliders`` for ``tmx_path``; failures are ignored."""
+    if not MAP_CACHE_ENABLED:
+        return
+    cache_file = _cache_file(tmx_path, collision_layers, collider_inputs)
+    if cache_file is None:
+        return
+    pixel_format = "RGBA" if surface.get_flags() & pygame.SRCALPHA else "RGB"
+    entry = {
+        "size": surface.get_size(),
+        "format": pixel_format,
+        "pixels": pygame.image.tostring(surface, pixel_format),
+        "colliders": [tuple(rect) for rect in colliders],
+    }
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        # Write aside and rename so a concurrent reader never sees half a file.
+        fd, tmp_name = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "wb") as handle:
+            pickle.dump(entry, handle, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_name, cache_file)
+    except OSError:
+        Path(tmp_name).unlink(missing_ok=True)
@@ -1,28 +1,69 @@
 from __future__ import annotations
 
+import re
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Callable
+from typing import TYPE_CHECKING, Any, Callable
 
 import pygame
 
-from core.settings import MAP_CAVE, MAP_INTERIOR_HOME, MAP_OUTSIDE_FOREST, MAP_OUTSIDE_VILLAGE, TILE_SIZE
+from core.pool import SCRATCH_RECT
+from core.settings import (
+    COLLIDER_CELL_SIZE,
+    INTERACTABLE_CELL_SIZE,
+    MAP_CAVE,
+    MAP_INTERIOR_HOME,
+    MAP_OUTSIDE_FOREST,
+    MAP_OUTSIDE_VILLAGE,
+    TILE_SIZE,
+)
 from entities.interactables import DoorInteractable, Interactable, LoreObject, NPC, QuestItem
+from world import map_cache
+from world.collision import build_index_grid, coalesce_tile_rects
 from world.tmx_loader import (
     extract_rects_from_object_layers,
     extract_rects_from_tile_layers,
     iter_objects_by_layer,
+    load_tmx_data,
     load_tmx_surface,
 )
 
+if TYPE_CHECKING:
+    from pytmx import TiledMap
+
 
 ASSETS_DIR = Path(__file__).resolve().parents[2] / "assets"
+# "x,y" with optional signs and whitespace around either number.
+_SPAWN_RE = re.compile(r"\s*(-?\d+)\s*,\s*(-?\d+)\s*")
+
+
+@dataclass(slots=True)
+class InteractableSpec:
+    """Plain-data recipe for an interactable; ``kind`` picks the class."""
+
+    kind: str
+    object_id: str
+    rect: tuple[int, int, int, int]
+    args: tuple = ()
+    options: dict[str, Any] = field(default_factory=dict)
+
+    def build(self) -> Interactable:
+        factory = INTERACTABLE_TYPES[self.kind]
+        return factory(self.object_id, pygame.Rect(self.rect), *self.args, **self.options)
+
+
+INTERACTABLE_TYPES: dict[str, type[Interactable]] = {
+    "door": DoorInteractable,
+    "npc": NPC,
+    "lore": LoreObject,
+    "quest_item": QuestItem,
+}
 
 
 @dataclass(slots=True)
 class MapDefinition:
     spawn: tuple[int, int]
-    interactables: list[Callable[[], Interactable]] = field(default_factory=list)
+    interactables: tuple[InteractableSpec, ...] = ()
     colliders: list[pygame.Rect] = field(default_factory=list)
     size: tuple[int, int] | None = None
     color: tuple[int, int, int] | None = None
@@ -31,63 +72,109 @@ class MapDefinition:
     interactable_layers: tuple[str, ...] = ()
 
 
+@dataclass(slots=True)
+class MapData:
+    """The parts of a map that can be prepared off the main thread.
+
+    Holds no Surfaces: cached pixels stay raw bytes until GameMap turns
+    them into a display surface on the main thread.
+    """
+
+    map_id: str
+    definition: MapDefinition
+    tmx_data: TiledMap | None
+    # Solid colliders with doors cut out and runs merged.
+    colliders: list[pygame.Rect]
+    blockers: list[pygame.Rect]
+    cached: map_cache.CachedMap | None = None
+    collider_inputs: tuple = ()
+
+
+def load_map_data(map_id: str, definition: MapDefinition) -> MapData:
+    """Parse the map and build its colliders; safe to call from any thread."""
+    door_rects: list[pygame.Rect] = []
+    blockers: list[pygame.Rect] = []
+    for spec in definition.interactables:
+        if spec.kind == "quest_item":
+            continue
+        if spec.kind == "door":
+            door_rects.append(pygame.Rect(spec.rect))
+            continue
+        blockers.append(pygame.Rect(spec.rect))
+    if door_rects:
+        blockers = [rect for rect in blockers if rect.collidelist(door_rects) == -1]
+
+    if definition.tmx_path is None:
+        if definition.size is None or definition.color is None:
+            raise ValueError("Non-TMX maps require size and color.")
+        colliders = [rect.copy() for rect in definition.colliders]
+        colliders = _solid_colliders(colliders, door_rects, TILE_SIZE, TILE_SIZE)
+        return MapData(map_id, definition, None, colliders, blockers)
+
+    # The solid colliders depend on the doors cut out of them and any
+    # hand-placed extras, so both are part of the cache key.
+    collider_inputs = (
+        tuple(tuple(rect) for rect in door_rects),
+        tuple(tuple(rect) for rect in definition.colliders),
+    )
+    tmx_data = load_tmx_data(definition.tmx_path)
+    cached = map_cache.load(definition.tmx_path, definition.collision_layers, collider_inputs)
+    if cached is not None:
+        colliders = cached.colliders
+    else:
+        colliders = [rect.copy() for rect in definition.colliders]
+        if definition.collision_layers:
+            colliders.extend(extract_rects_from_tile_layers(tmx_data, definition.collision_layers))
+            colliders.extend(extract_rects_from_object_layers(tmx_data, definition.collision_layers))
+        tile_w = tmx_data.tilewidth
+        tile_h = tmx_data.tileheight
+        if not colliders:
+            width = tmx_data.width * tile_w
+            height = tmx_data.height * tile_h
+            colliders = [
+                pygame.Rect(0, 0, width, tile_h),  # top boundary
+                pygame.Rect(0, height - tile_h, width, tile_h),  # bottom boundary
+                pygame.Rect(0, 0, tile_w, height),  # left boundary
+                pygame.Rect(width - tile_w, 0, tile_w, height),  # right boundary
+            ]
+        colliders = _solid_colliders(colliders, door_rects, tile_w, tile_h)
+    return MapData(map_id, definition, tmx_data, colliders, blockers, cached, collider_inputs)
+
+
 class GameMap:
-    def __init__(self, map_id: str, definition: MapDefinition) -> None:
-        self.map_id = map_id
+    def __init__(self, data: MapData) -> None:
+        """Create the map's surfaces and interactables from ``data``. Main thread only."""
+        definition = data.definition
+        self.map_id = data.map_id
         self.definition = definition
-        self.tmx_data = None
-        self.colliders: list[pygame.Rect] = []
+        self.tmx_data = data.tmx_data
+        self.interactables = [spec.build() for spec in definition.interactables]
 
         if definition.tmx_path is not None:
-            surface, tmx_data = load_tmx_surface(definition.tmx_path)
-            self.surface = surface
-            self.tmx_data = tmx_data
-            self._size = surface.get_size()
-            if definition.colliders:
-                self.colliders.extend(rect.copy() for rect in definition.colliders)
-
-            if definition.collision_layers:
-                self.colliders.extend(
-                    extract_rects_from_tile_layers(tmx_data, definition.collision_layers)
+            if data.cached is not None:
+                self.surface = data.cached.to_surface()
+            else:
+                # Rendering needs the tile images, which load_pygame converts
+                # to display format, so it cannot happen on the loader thread.
+                self.surface, _ = load_tmx_surface(definition.tmx_path)
+                map_cache.store(
+                    definition.tmx_path,
+                    definition.collision_layers,
+                    data.collider_inputs,
+                    self.surface,
+                    data.colliders,
                 )
-                self.colliders.extend(
-                    extract_rects_from_object_layers(tmx_data, definition.collision_layers)
-                )
-
-            if not self.colliders:
-                tile_w = tmx_data.tilewidth
-                tile_h = tmx_data.tileheight
-                width, height = self._size
-                self.colliders = [
-                    pygame.Rect(0, 0, width, tile_h),  # top boundary
-                    pygame.Rect(0, height - tile_h, width, tile_h),  # bottom boundary
-                    pygame.Rect(0, 0, tile_w, height),  # left boundary
-                    pygame.Rect(width - tile_w, 0, tile_w, height),  # right boundary
-                ]
+            self._size = self.surface.get_size()
+            self.colliders = data.colliders
         else:
-            if definition.size is None or definition.color is None:
-                raise ValueError("Non-TMX maps require size and color.")
-            self.surface = pygame.Surface(definition.size)
+            self.surface = pygame.Surface(definition.size).convert()
             self.surface.fill(definition.color)
             self._size = definition.size
-            self.colliders = [rect.copy() for rect in definition.colliders]
+            self.colliders = data.colliders
             self._draw_collision_debug()
+        # Interactable blockers stay separate: they are removed by value later.
+        self.colliders.extend(data.blockers)
 
-        self.interactables = [factory() for factory in definition.interactables]
-        door_rects: list[pygame.Rect] = []
-        for interactable in self.interactables:
-            if isinstance(interactable, QuestItem):
-                continue
-            if isinstance(interactable, DoorInteractable):
-                door_rects.append(interactable.rect.copy())
-                continue
-            self.colliders.append(interactable.rect.copy())
-        if door_rects:
-            self.colliders = [
-                rect
-                for rect in self.colliders
-                if not any(rect.colliderect(door_rect) for door_rect in door_rects)
-            ]
         if definition.tmx_path is not None:
             tmx_interactables = self._load_tmx_interactables(definition)
             if tmx_interactables:
@@ -95,9 +182,69 @@ class GameMap:
                     self.interactables.extend(tmx_interactables)
                 else:
                     self.interactables = tmx_interactables
-        if definition.tmx_path is not None:
             definition.size = self._size
 
+        self.collider_grid = build_index_grid(self.colliders, COLLIDER_CELL_SIZE)
+        self.interactable_rects: list[pygame.Rect] = []
+        self.interactable_hit_rects: list[pygame.Rect] = []
+        self.interactable_grid: dict[tuple[int, int], list[int]] = {}
+        self._by_id: dict[str, Interactable] = {}
+        self.rebuild_interactable_index()
+
+    def rebuild_collider_grid(self) -> None:
+        """Re-bucket colliders; call after mutating ``colliders``."""
+        self.collider_grid = build_index_grid(self.colliders, COLLIDER_CELL_SIZE)
+
+    def query(self, rect: pygame.Rect) -> list[pygame.Rect]:
+        """Return the colliders sharing a grid cell with ``rect``, each once."""
+        cell = COLLIDER_CELL_SIZE
+        grid = self.collider_grid
+        colliders = self.colliders
+        x0 = rect.left // cell
+        x1 = (rect.right - 1) // cell
+        y0 = rect.top // cell
+        y1 = (rect.bottom - 1) // cell
+        if x0 == x1 and y0 == y1:
+            return [colliders[index] for index in grid.get((x0, y0), ())]
+
+        # A large collider sits in many cells; the set drops the repeats.
+        indices: set[int] = set()
+        for cx in range(x0, x1 + 1):
+            for cy in range(y0, y1 + 1):
+                bucket = grid.get((cx, cy))
+                if bucket:
+                    indices.update(bucket)
+        return [colliders[index] for index in sorted(indices)]
+
+    def rebuild_interactable_index(self) -> None:
+        """Refresh cached rects and ids; call after adding or moving interactables."""
+        self.interactable_rects = [interactable.rect for interactable in self.interactables]
+        self.interactable_hit_rects = [interactable.hit_rect for interactable in self.interactables]
+        self.interactable_grid = build_index_grid(self.interactable_hit_rects, INTERACTABLE_CELL_SIZE)
+        # Reversed so the first interactable with a given id wins, as a scan would.
+        self._by_id = {
+            interactable.object_id: interactable for interactable in reversed(self.interactables)
+        }
+
+    def interactable_near(self, player_rect: pygame.Rect) -> Interactable | None:
+        """Return the first enabled interactable whose hit area touches ``player_rect``."""
+        cell = INTERACTABLE_CELL_SIZE
+        grid = self.interactable_grid
+        hit_rects = self.interactable_hit_rects
+        interactables = self.interactables
+        # Earliest list position wins, matching a front-to-back scan.
+        best = len(interactables)
+        for cx in range(player_rect.left // cell, (player_rect.right - 1) // cell + 1):
+            for cy in range(player_rect.top // cell, (player_rect.bottom - 1) // cell + 1):
+                for index in grid.get((cx, cy), ()):
+                    if (
+                        index < best
+                        and interactables[index].enabled
+                        and hit_rects[index].colliderect(player_rect)
+                    ):
+                        best = index
+        return interactables[best] if best < len(interactables) else None
+
     def _draw_collision_debug(self) -> None:
         for rect in self.colliders:
             pygame.draw.rect(self.surface, (40, 60, 40), rect, 0)
@@ -112,86 +259,166 @@ class GameMap:
             return []
 
         interactables: list[Interactable] = []
-
-        def parse_spawn(data: dict) -> tuple[int, int] | None:
-            if "target_spawn" in data and isinstance(data["target_spawn"], str):
-                bits = [part.strip() for part in data["target_spawn"].split(",")]
-                if len(bits) == 2 and all(part.lstrip("-").isdigit() for part in bits):
-                    return int(bits[0]), int(bits[1])
-            if "spawn_x" in data and "spawn_y" in data:
-                try:
-                    return int(data["spawn_x"]), int(data["spawn_y"])
-                except (TypeError, ValueError):
-                    return None
-            return None
-
         for obj in iter_objects_by_layer(self.tmx_data, definition.interactable_layers):
-            props = dict(getattr(obj, "properties", {}))
+            # pytmx already hands out a fresh dict per object; no need to copy.
+            props = obj.properties
+            kind = (props.get("type") or getattr(obj, "type", "") or "").lower()
+            handler = _TMX_HANDLERS.get(kind)
+            if handler is None:
+                continue
             object_id = str(props.get("id") or obj.name or f"{self.map_id}_obj_{len(interactables)}")
-            kind = str(props.get("type") or getattr(obj, "type", "")).lower()
-            dialogue_id = props.get("dialogue_id")
             rect = pygame.Rect(
                 int(obj.x),
                 int(obj.y),
                 int(obj.width or TILE_SIZE),
                 int(obj.height or TILE_SIZE),
             )
-
-            if kind == "door":
-                target_map = props.get("target_map")
-                spawn = parse_spawn(props)
-                if target_map and spawn:
-                    interactables.append(
-                        DoorInteractable(object_id, rect, target_map, spawn, props.get("dialogue_id"))
-                    )
-            elif kind == "npc":
-                if dialogue_id:
-                    interactables.append(NPC(object_id, rect, dialogue_id))
-            elif kind in {"lore", "object"}:
-                if dialogue_id:
-                    interactables.append(LoreObject(object_id, rect, dialogue_id))
-            elif kind in {"quest_item", "questitem"}:
-                event_name = props.get("event") or props.get("quest_event")
-                if dialogue_id and event_name:
-                    interactables.append(QuestItem(object_id, rect, dialogue_id, str(event_name)))
+            interactable = handler(props, object_id, rect)
+            if interactable is not None:
+                interactables.append(interactable)
 
         return interactables
 
 
+def _solid_colliders(
+    colliders: list[pygame.Rect],
+    door_rects: list[pygame.Rect],
+    tile_w: int,
+    tile_h: int,
+) -> list[pygame.Rect]:
+    """Drop colliders over doors, then merge the rest into fewer rects."""
+    # Doors are cut out first so a merged wall never swallows one.
+    if door_rects:
+        colliders = [rect for rect in colliders if rect.collidelist(door_rects) == -1]
+    return coalesce_tile_rects(colliders, tile_w, tile_h)
+
+
+def _parse_spawn(data: dict) -> tuple[int, int] | None:
+    target_spawn = data.get("target_spawn")
+    if isinstance(target_spawn, str):
+        match = _SPAWN_RE.fullmatch(target_spawn)
+        if match:
+            return int(match.group(1)), int(match.group(2))
+    if "spawn_x" in data and "spawn_y" in data:
+        try:
+            return int(data["spawn_x"]), int(data["spawn_y"])
+        except (TypeError, ValueError):
+            return None
+    return None
+
+
+def _make_door(props: dict, object_id: str, rect: pygame.Rect) -> Interactable | None:
+    target_map = props.get("target_map")
+    spawn = _parse_spawn(props)
+    if target_map and spawn:
+        return DoorInteractable(object_id, rect, target_map, spawn, props.get("dialogue_id"))
+    return None
+
+
+def _make_npc(props: dict, object_id: str, rect: pygame.Rect) -> Interactable | None:
+    dialogue_id = props.get("dialogue_id")
+    return NPC(object_id, rect, dialogue_id) if dialogue_id else None
+
+
+def _make_lore(props: dict, object_id: str, rect: pygame.Rect) -> Interactable | None:
+    dialogue_id = props.get("dialogue_id")
+    return LoreObject(object_id, rect, dialogue_id) if dialogue_id else None
+
+
+def _make_quest_item(props: dict, object_id: str, rect: pygame.Rect) -> Interactable | None:
+    dialogue_id = props.get("dialogue_id")
+    event_name = props.get("event") or props.get("quest_event")
+    if dialogue_id and event_name:
+        return QuestItem(object_id, rect, dialogue_id, str(event_name))
+    return None
+
+
+# TMX object ``type`` (lowercased) -> builder; unknown kinds are skipped.
+_TMX_HANDLERS: dict[str, Callable[[dict, str, pygame.Rect], Interactable | None]] = {
+    "door": _make_door,
+    "npc": _make_npc,
+    "lore": _make_lore,
+    "object": _make_lore,
+    "quest_item": _make_quest_item,
+    "questitem": _make_quest_item,
+}
+
+
+@dataclass(slots=True)
+class PendingMap:
+    """A map change prepared by MapManager.prepare_map, ready to finish."""
+
+    map_id: str
+    spawn: tuple[int, int]
+    # None when the map was already built by an earlier visit.
+    data: MapData | None
+
+
 class MapManager:
     def __init__(self) -> None:
+        # Maps are built the first time they are finished, then kept.
+        self.definitions = _create_map_definitions()
         self.maps: dict[str, GameMap] = {}
         self.current_map: GameMap | None = None
         self.pending_spawn: tuple[int, int] | None = None
-        self._build_maps()
 
-    def _build_maps(self) -> None:
-        for map_id, definition in _create_map_definitions().items():
-            self.maps[map_id] = GameMap(map_id, definition)
+    def prepare_map(self, map_id: str, spawn: tuple[int, int] | None = None) -> PendingMap:
+        """Do the loading work for ``map_id`` that needs no display.
 
-    def load_map(self, map_id: str, spawn: tuple[int, int] | None = None) -> tuple[int, int]:
-        if map_id not in self.maps:
+        Creates no Surfaces and changes no state, so it may run on a loader
+        thread while the main thread keeps drawing; hand the result to
+        finish_map on the main thread.
+        """
+        definition = self.definitions.get(map_id)
+        if definition is None:
             raise KeyError(f"Map '{map_id}' is not defined.")
+        data = None if map_id in self.maps else load_map_data(map_id, definition)
+        return PendingMap(map_id, spawn or definition.spawn, data)
 
-        self.current_map = self.maps[map_id]
-        return spawn or self.current_map.definition.spawn
+    def finish_map(self, pending: PendingMap) -> tuple[GameMap, tuple[int, int]]:
+        """Return the map for ``pending`` and its spawn, building it if needed.
 
-    def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2) -> None:
-        if not self.current_map:
-            return
-        map_surface = self.current_map.surface
-        surface.blit(map_surface, (-camera_offset.x, -camera_offset.y))
+        Main thread only; pair it with swap_to.
+        """
+        game_map = self.maps.get(pending.map_id)
+        if game_map is None:
+            game_map = GameMap(pending.data)
+            self.maps[pending.map_id] = game_map
+        return game_map, pending.spawn
 
-        for interactable in self.current_interactables:
-            interactable.draw(surface, camera_offset)
+    def swap_to(self, game_map: GameMap) -> None:
+        """Make an already finished map current. Main thread only."""
+        self.current_map = game_map
 
-    @property
-    def current_interactables(self) -> list[Interactable]:
-        return self.current_map.interactables if self.current_map else []
+    def load_map(self, map_id: str, spawn: tuple[int, int] | None = None) -> tuple[int, int]:
+        game_map, spawn_pos = self.finish_map(self.prepare_map(map_id, spawn))
+        self.swap_to(game_map)
+        return spawn_pos
 
-    @property
-    def collision_rects(self) -> list[pygame.Rect]:
-        return self.current_map.colliders if self.current_map else []
+    def draw(self, surface: pygame.Surface, camera_offset: pygame.Vector2) -> None:
+        if not self.current_map:
+            return
+        ox = -int(camera_offset.x)
+        oy = -int(camera_offset.y)
+        surface.blit(self.current_map.surface, (ox, oy))
+
+        # Cull against the view, padded so sprites taller than their rect
+        # are not clipped at the edges.
+        view = SCRATCH_RECT
+        view.update(-ox - 32, -oy - 32, surface.get_width() + 64, surface.get_height() + 64)
+        interactables = self.current_map.interactables
+        npc_blits: list[tuple[pygame.Surface, tuple[int, int]]] = []
+        for index in view.collidelistall(self.current_map.interactable_rects):
+            interactable = interactables[index]
+            if isinstance(interactable, NPC):
+                npc_blits.append(interactable.get_blit_tuple(ox, oy))
+            else:
+                interactable.draw(surface, ox, oy)
+        if npc_blits:
+            surface.blits(npc_blits, doreturn=False)
+
+    def query_colliders(self, rect: pygame.Rect) -> list[pygame.Rect]:
+        return self.current_map.query(rect) if self.current_map else []
 
     @property
     def map_rect(self) -> pygame.Rect:
@@ -199,13 +426,11 @@ class MapManager:
             return pygame.Rect(0, 0, TILE_SIZE * 10, TILE_SIZE * 10)
         return self.current_map.rect
 
+    def interactable_near(self, player_rect: pygame.Rect) -> Interactable | None:
+        return self.current_map.interactable_near(player_rect) if self.current_map else None
+
     def find_interactable(self, object_id: str) -> Interactable | None:
-        if not self.current_map:
-            return None
-        for interactable in self.current_map.interactables:
-            if interactable.object_id == object_id:
-                return interactable
-        return None
+        return self.current_map._by_id.get(object_id) if self.current_map else None
 
 
 def _create_map_definitions() -> dict[str, MapDefinition]:
@@ -213,69 +438,76 @@ def _create_map_definitions() -> dict[str, MapDefinition]:
         return pygame.Rect(x, y, w, h)
 
     def outside_village() -> MapDefinition:
-        interactables: list[Callable[[], Interactable]] = [
-            lambda: DoorInteractable(
+        interactables = (
+            InteractableSpec(
+                "door",
                 "home_front_door",
-                rect(53 * TILE_SIZE, 25 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                MAP_INTERIOR_HOME,
-                (31 * TILE_SIZE, 38 * TILE_SIZE),
+                (53 * TILE_SIZE, 25 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                (MAP_INTERIOR_HOME, (31 * TILE_SIZE, 38 * TILE_SIZE)),
             ),
-            lambda: DoorInteractable(
+            InteractableSpec(
+                "door",
                 "cave_entrance",
-                rect(6 * TILE_SIZE, 2 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                MAP_CAVE,
-                (34 * TILE_SIZE, 39 * TILE_SIZE),
+                (6 * TILE_SIZE, 2 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                (MAP_CAVE, (34 * TILE_SIZE, 39 * TILE_SIZE)),
             ),
-            lambda: NPC(
+            InteractableSpec(
+                "npc",
                 "npc_mia",
-                rect(56 * TILE_SIZE, 27 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                "mia_intro",
+                (56 * TILE_SIZE, 27 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                ("mia_intro",),
             ),
-            lambda: NPC(
+            InteractableSpec(
+                "npc",
                 "npc_sally",
-                rect(95 * TILE_SIZE, 22 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                "sally_missing",
-                sprite_path=ASSETS_DIR / "characters" / "salley.png",
+                (95 * TILE_SIZE, 22 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                ("sally_missing",),
+                {"sprite_path": ASSETS_DIR / "characters" / "salley.png"},
             ),
-            lambda: NPC(
+            InteractableSpec(
+                "npc",
                 "npc_fisher",
-                rect(50 * TILE_SIZE, 68 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                "fisher_intro",
-                sprite_path=ASSETS_DIR / "characters" / "old_fisher.png",
-                sprite_columns=4,
-                sprite_rows=4,
+                (50 * TILE_SIZE, 68 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                ("fisher_intro",),
+                {
+                    "sprite_path": ASSETS_DIR / "characters" / "old_fisher.png",
+                    "sprite_columns": 4,
+                    "sprite_rows": 4,
+                },
             ),
-            lambda: LoreObject(
+            InteractableSpec(
+                "lore",
                 "forest_sign",
-                rect(89 * TILE_SIZE, 33 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                "forest_sign",
-                visible=False,
+                (89 * TILE_SIZE, 33 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                ("forest_sign",),
+                {"visible": False},
             ),
-            lambda: LoreObject(
-                "cave_sign",
-                rect(5 * TILE_SIZE, 5 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+            InteractableSpec(
+                "lore",
                 "cave_sign",
-                visible=False,
+                (5 * TILE_SIZE, 5 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                ("cave_sign",),
+                {"visible": False},
             ),
-            lambda: QuestItem(
+            InteractableSpec(
+                "quest_item",
                 "quest_totem_b",
-                rect(300, 900, TILE_SIZE, TILE_SIZE),
-                "quest_item_b",
-                "quest_item_collected",
+                (300, 900, TILE_SIZE, TILE_SIZE),
+                ("quest_item_b", "quest_item_collected"),
             ),
-            lambda: QuestItem(
+            InteractableSpec(
+                "quest_item",
                 "quest_totem_c",
-                rect(1250, 900, TILE_SIZE, TILE_SIZE),
-                "quest_item_c",
-                "quest_item_collected",
+                (1250, 900, TILE_SIZE, TILE_SIZE),
+                ("quest_item_c", "quest_item_collected"),
             ),
-            lambda: QuestItem(
+            InteractableSpec(
+                "quest_item",
                 "quest_flower",
-                rect(106 * TILE_SIZE, 25 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                "sally_flower_item",
-                "flower_found",
+                (106 * TILE_SIZE, 25 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                ("sally_flower_item", "flower_found"),
             ),
-        ]
+        )
 
         return MapDefinition(
             spawn=(960, 640),
@@ -287,15 +519,14 @@ def _create_map_definitions() -> dict[str, MapDefinition]:
         )
 
     def interior_home() -> MapDefinition:
-        door_rect = rect(31 * TILE_SIZE, 39 * TILE_SIZE, TILE_SIZE * 2, TILE_SIZE)
-        interactables = [
-            lambda: DoorInteractable(
+        interactables = (
+            InteractableSpec(
+                "door",
                 "home_exit",
-                door_rect,
-                MAP_OUTSIDE_VILLAGE,
-                (53 * TILE_SIZE, 25 * TILE_SIZE),
+                (31 * TILE_SIZE, 39 * TILE_SIZE, TILE_SIZE * 2, TILE_SIZE),
+                (MAP_OUTSIDE_VILLAGE, (53 * TILE_SIZE, 25 * TILE_SIZE)),
             ),
-        ]
+        )
 
         return MapDefinition(
             spawn=(31 * TILE_SIZE, 38 * TILE_SIZE),
@@ -306,26 +537,27 @@ def _create_map_definitions() -> dict[str, MapDefinition]:
         )
 
     def cave() -> MapDefinition:
-        interactables: list[Callable[[], Interactable]] = [
-            lambda: DoorInteractable(
+        interactables = (
+            InteractableSpec(
+                "door",
                 "cave_exit",
-                rect(34 * TILE_SIZE, 39 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                MAP_OUTSIDE_VILLAGE,
-                (6 * TILE_SIZE, 2 * TILE_SIZE),
+                (34 * TILE_SIZE, 39 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                (MAP_OUTSIDE_VILLAGE, (6 * TILE_SIZE, 2 * TILE_SIZE)),
             ),
-            lambda: QuestItem(
+            InteractableSpec(
+                "quest_item",
                 "cave_heart_shard",
-                rect(7 * TILE_SIZE, 26 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                "cave_chest",
-                "quest_item_collected",
+                (7 * TILE_SIZE, 26 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                ("cave_chest", "quest_item_collected"),
             ),
-            lambda: LoreObject(
+            InteractableSpec(
+                "lore",
                 "cave_warning_sign",
-                rect(35 * TILE_SIZE, 32 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
-                "cave_warning",
-                visible=False,
+                (35 * TILE_SIZE, 32 * TILE_SIZE, TILE_SIZE, TILE_SIZE),
+                ("cave_warning",),
+                {"visible": False},
             ),
-        ]
+        )
 
         return MapDefinition(
             spawn=(34 * TILE_SIZE, 39 * TILE_SIZE),
@@ -337,18 +569,20 @@ def _create_map_definitions() -> dict[str, MapDefinition]:
 
     def outside_forest() -> MapDefinition:
         width, height = 1800, 1400
-        interactables = [
-            lambda: NPC(
+        interactables = (
+            InteractableSpec(
+                "npc",
                 "elder_rhea",
-                rect(900, 700, TILE_SIZE, TILE_SIZE + 16),
-                "quest_complete",
+                (900, 700, TILE_SIZE, TILE_SIZE + 16),
+                ("quest_complete",),
             ),
-            lambda: LoreObject(
-                "forest_shrine",
-                rect(900, 540, TILE_SIZE * 2, TILE_SIZE),
+            InteractableSpec(
+                "lore",
                 "forest_shrine",
+                (900, 540, TILE_SIZE * 2, TILE_SIZE),
+                ("forest_shrine",),
             ),
-        ]
+        )
 
         colliders = [
             rect(400, 400, 1000, 80),
@@ -371,4 +605,3 @@ def _create_map_definitions() -> dict[str, MapDefinition]:
         MAP_OUTSIDE_FOREST: outside_forest(),
         MAP_CAVE: cave(),
     }
-
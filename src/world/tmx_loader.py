@@ -4,9 +4,11 @@ from pathlib import Path
 from typing import Iterable
 
 import pygame
-from pytmx import TiledObjectGroup, TiledTileLayer
+from pytmx import TiledMap, TiledObjectGroup, TiledTileLayer
 from pytmx.util_pygame import load_pygame
 
+from core.render import blit_many
+
 
 class TMXLoadError(RuntimeError):
     """Raised when a TMX map cannot be loaded or rendered."""
@@ -21,18 +23,65 @@ def load_tmx_surface(path: Path) -> tuple[pygame.Surface, "TiledMap"]:
     width = tmx_data.width * tmx_data.tilewidth
     height = tmx_data.height * tmx_data.tileheight
 
-    surface = pygame.Surface((width, height), flags=pygame.SRCALPHA)
-
-    for layer in tmx_data.visible_layers:
-        if isinstance(layer, TiledTileLayer):
-            for x, y, gid in layer:
-                tile_image = tmx_data.get_tile_image_by_gid(gid)
-                if tile_image:
-                    surface.blit(tile_image, (x * tmx_data.tilewidth, y * tmx_data.tileheight))
+    tile_layers = [layer for layer in tmx_data.visible_layers if isinstance(layer, TiledTileLayer)]
+    # A fully covered, fully opaque ground layer leaves no transparent pixel
+    # behind, so the map can live on a plain display-format surface.
+    opaque_base = bool(tile_layers) and _is_opaque_cover(tmx_data, tile_layers[0])
+    if opaque_base:
+        surface = pygame.Surface((width, height)).convert()
+    else:
+        surface = pygame.Surface((width, height), flags=pygame.SRCALPHA)
+
+    # Collect every tile first and hand them to SDL in one call; order is
+    # kept so later layers still draw over earlier ones. load_pygame has
+    # already put each tile image in display format (plain for opaque
+    # tiles, per-pixel alpha otherwise), so the images are only looked up
+    # once per gid here rather than converted again.
+    tile_w = tmx_data.tilewidth
+    tile_h = tmx_data.tileheight
+    get_image = tmx_data.get_tile_image_by_gid
+    images: dict[int, pygame.Surface | None] = {}
+    blit_sequence: list[tuple[pygame.Surface, tuple[int, int]]] = []
+    for layer in tile_layers:
+        for y, row in enumerate(layer.data):
+            top = y * tile_h
+            for x, gid in enumerate(row):
+                if gid:
+                    if gid in images:
+                        tile_image = images[gid]
+                    else:
+                        tile_image = images[gid] = get_image(gid)
+                    if tile_image:
+                        blit_sequence.append((tile_image, (x * tile_w, top)))
+    blit_many(surface, blit_sequence)
 
     return surface, tmx_data
 
 
+def _is_opaque_cover(tmx_data: TiledMap, layer: TiledTileLayer) -> bool:
+    """True if ``layer`` has a tile in every cell and none of them is see-through."""
+    gids: set[int] = set()
+    for row in layer.data:
+        gids.update(row)
+    if 0 in gids:
+        return False
+    for gid in gids:
+        image = tmx_data.get_tile_image_by_gid(gid)
+        if image is None:
+            return False
+        width, height = image.get_size()
+        if pygame.mask.from_surface(image, 254).count() != width * height:
+            return False
+    return True
+
+
+def load_tmx_data(path: Path) -> TiledMap:
+    """Parse a TMX map for its layers and objects without loading tile images."""
+    if not path.exists():
+        raise TMXLoadError(f"TMX file not found: {path}")
+    return TiledMap(str(path))
+
+
 def extract_rects_from_object_layers(
     tmx_data: "TiledMap",
     layer_names: Iterable[str],
@@ -60,9 +109,15 @@ def extract_rects_from_tile_layers(
 
     for layer in tmx_data.layers:
         if isinstance(layer, TiledTileLayer) and layer.name and layer.name.lower() in desired:
-            for x, y, gid in layer:
-                if gid:
-                    rects.append(pygame.Rect(x * tile_w, y * tile_h, tile_w, tile_h))
+            # Walk the raw gid rows instead of the (x, y, gid) iterator, and
+            # skip rows with nothing solid in them outright.
+            for y, row in enumerate(layer.data):
+                if not any(row):
+                    continue
+                top = y * tile_h
+                for x, gid in enumerate(row):
+                    if gid:
+                        rects.append(pygame.Rect(x * tile_w, top, tile_w, tile_h))
     return rects
 
 